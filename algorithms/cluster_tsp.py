@@ -0,0 +1,227 @@
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from algorithms.genetic_algorithm import GeneticTSP
+from algorithms.local_search_tsp import TSPLocalSearch
+from problems.discrete.problem8_tsp import edge_lengths, route_length
+
+
+def _solve_group(cities, points, seed, ga_kwargs):
+    """
+    Sub-tour of one group, solved by GeneticTSP.
+    `points` holds only this group's cities; the tour uses the global
+    indices in `cities`.
+    """
+    if len(cities) <= 3:
+        return cities  # every order of <= 3 cities has the same length
+
+    ga = GeneticTSP(points, rng=np.random.default_rng(seed), **ga_kwargs)
+    best_ind, _ = ga.run()
+    return cities[best_ind.astype(int)]
+
+
+class ClusterFirstTSP:
+    """
+    Cluster-first, route-second TSP solver for grouped instances.
+
+    1. each group's sub-tour is solved independently (in parallel);
+    2. the order in which groups are visited is solved as a small TSP;
+    3. sub-tours are cut open and joined, choosing cut edges and directions
+       by dynamic programming, and a 2-opt/Or-opt pass repairs the seams.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        (N, 3) city coordinates.
+    groups : np.ndarray
+        (N,) group label of every city.
+    workers : int or None
+        Processes used for the per-group solves (None = all cores).
+    seed : int or None
+        Master seed for the per-group GAs.
+    exact_order_limit : int
+        Up to this many groups, every visiting order is scored exactly.
+    cut_candidates : int or None
+        A sub-tour is only cut open at edges touching one of the
+        cut_candidates cities of its group nearest to each other group's
+        centroid (None = every edge), which keeps the stitching cost
+        independent of the group sizes.
+    **ga_kwargs
+        Forwarded to GeneticTSP for the per-group solves.
+    """
+
+    def __init__(self, points, groups, workers=None, seed=None,
+                 exact_order_limit=8, cut_candidates=8, **ga_kwargs):
+        self.points = np.asarray(points, dtype=float)
+        self.groups = np.asarray(groups)
+        self.workers = workers
+        self.seed = seed
+        self.exact_order_limit = exact_order_limit
+        self.cut_candidates = cut_candidates
+        self.ga_kwargs = ga_kwargs
+
+        self._blocks = {}  # (g, h) -> exit-to-entry distances, per run
+
+    # -----------------------------------------------------
+    # STITCHING
+    # -----------------------------------------------------
+
+    def _dist(self, a, b):
+        """(len(a), len(b)) distances between two sets of cities."""
+        return np.linalg.norm(self.points[a][:, None, :] - self.points[b][None, :, :], axis=2)
+
+    def _block(self, options, g, h):
+        """Distances from the exits of group g's options to the entries of h's."""
+        if (g, h) not in self._blocks:
+            self._blocks[g, h] = self._dist(options[g][1], options[h][0])
+        return self._blocks[g, h]
+
+    def _near_cities(self, cities, other_centroids):
+        """The cut_candidates cities nearest to each other group's centroid."""
+        k = self.cut_candidates
+        if k is None or len(other_centroids) == 0 or len(cities) <= k:
+            return None
+        d = np.linalg.norm(self.points[cities][:, None, :] - other_centroids[None, :, :], axis=2)
+        return np.unique(cities[np.argpartition(d, k - 1, axis=0)[:k]])
+
+    def _cut_options(self, tour, near=None):
+        """
+        The ways of opening a sub-tour into a path: remove one edge (one
+        touching a city of `near`, when given) and walk the cycle in either
+        direction.
+        Returns (entries, exits, internal_costs, paths).
+        """
+        m = len(tour)
+        if m == 1:
+            return tour.copy(), tour.copy(), np.zeros(1), [tour]
+
+        nxt = np.roll(tour, -1)
+        lengths = edge_lengths(tour, nxt, points=self.points)
+        internal = lengths.sum() - lengths
+
+        cuts = np.arange(m)
+        if near is not None:
+            cuts = np.flatnonzero(np.isin(tour, near) | np.isin(nxt, near))
+
+        # cutting edge (tour[t], tour[t+1]): forward path starts at tour[t+1]
+        forward = [np.roll(tour, -(t + 1)) for t in cuts]
+        backward = [p[::-1] for p in forward]
+
+        entries = np.concatenate([nxt[cuts], tour[cuts]])
+        exits = np.concatenate([tour[cuts], nxt[cuts]])
+        internal = internal[cuts]
+        return entries, exits, np.concatenate([internal, internal]), forward + backward
+
+    def _stitch(self, options, order):
+        """
+        Best way of joining the sub-tours visited in `order`.
+        Dynamic programming over groups; the first group's cut is fixed per
+        row so the closing edge back to it can be added at the end.
+        """
+        cost0 = options[order[0]][2]
+
+        # cost[r, o]: best partial cost when the first group uses option r
+        # and the current group uses option o (for the first group, o == r)
+        cost = np.full((len(cost0), len(cost0)), np.inf)
+        np.fill_diagonal(cost, cost0)
+        back = []
+
+        for prev, g in zip(order, order[1:]):
+            step = cost[:, :, None] + self._block(options, prev, g)[None, :, :]
+            best_prev = np.argmin(step, axis=1)
+            cost = np.take_along_axis(step, best_prev[:, None, :], axis=1)[:, 0, :] + options[g][2]
+            back.append(best_prev)
+
+        total = cost + self._block(options, order[-1], order[0]).T
+        o0, last = np.unravel_index(np.argmin(total), total.shape)
+
+        # walk the back-pointers to recover the chosen cut of every group
+        chosen = [last]
+        for bp in reversed(back):
+            chosen.append(bp[o0, chosen[-1]])
+        chosen.reverse()
+
+        route = np.concatenate([options[g][3][c] for g, c in zip(order, chosen)])
+        return route, float(total[o0, last])
+
+    # -----------------------------------------------------
+    # GROUP ORDER
+    # -----------------------------------------------------
+
+    def _best_order(self, options, labels):
+        """Visiting order of the groups (labels[0] always first)."""
+        # the first group's cuts are enumerated explicitly: use the smallest
+        labels = sorted(labels, key=lambda g: len(options[g][0]))
+        if len(labels) <= self.exact_order_limit:
+            best = None
+            for perm in itertools.permutations(labels[1:]):
+                order = [labels[0], *perm]
+                route, cost = self._stitch(options, order)
+                if best is None or cost < best[2]:
+                    best = (order, route, cost)
+            return best
+
+        # many groups: order their centroids with a small local search
+        centroids = np.array([self.points[self.groups == g].mean(axis=0) for g in labels])
+        ls = TSPLocalSearch(centroids, k=min(8, len(labels) - 1))
+        tour, _ = ls.improve(np.arange(len(labels)))
+        order = [labels[i] for i in tour]
+        route, cost = self._stitch(options, order)
+        return order, route, cost
+
+    # -----------------------------------------------------
+    # MAIN LOOP
+    # -----------------------------------------------------
+
+    def run(self):
+        """
+        Returns
+        -------
+        route : np.ndarray
+            Full tour over all cities.
+        cost : float
+            Its length.
+        stats : dict
+            Group order, cost before the seam repair and timings.
+        """
+        start = time.time()
+        labels = [int(g) for g in np.unique(self.groups)]
+        members = [np.flatnonzero(self.groups == g) for g in labels]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(labels))
+
+        # 1) independent sub-tours
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            # each task only receives its own group's points
+            tours = list(pool.map(_solve_group, members,
+                                  [self.points[m] for m in members],
+                                  seeds,
+                                  [self.ga_kwargs] * len(labels)))
+        t_groups = time.time() - start
+
+        # 2) + 3) group order and stitching (only the inter-group distance
+        # blocks between cut candidates are ever computed)
+        centroids = np.array([self.points[m].mean(axis=0) for m in members])
+        options = {}
+        self._blocks = {}
+        for i, (g, t) in enumerate(zip(labels, tours)):
+            near = self._near_cities(members[i], np.delete(centroids, i, axis=0))
+            options[g] = self._cut_options(t, near)
+        order, route, stitched_cost = self._best_order(options, labels)
+
+        # seam repair: local search seeded with the cities around each join
+        joins = np.cumsum([len(options[g][3][0]) for g in order])[:-1]
+        seams = np.concatenate([route[joins - 1], route[joins], route[[0, -1]]])
+        ls = TSPLocalSearch(self.points)
+        route, _ = ls.improve(route, start=seams)
+        cost = route_length(route, self.points)
+
+        stats = {
+            "group_order": order,
+            "stitched_cost": stitched_cost,
+            "repair_moves": ls.moves,
+            "time_groups": t_groups,
+            "time": time.time() - start,
+        }
+        return route, cost, stats
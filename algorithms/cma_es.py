@@ -0,0 +1,136 @@
+import numpy as np
+
+from algorithms.objective import evaluate_block
+
+class CMAES:
+    """
+    (mu/mu_w, lambda)-CMA-ES for continuous optimization with box
+    constraints. Each generation samples the whole offspring population as
+    one (lambda, dim) array and evaluates it with a single objective call.
+
+    Parameters
+    ----------
+    f : callable
+        Objective function f(x1, x2, ...), or f(X) on an (n, dim) array of
+        points when vectorized=True. Minimization.
+    domain : list of tuples or (dim, 2) array
+        Domain of each variable [(min_x1, max_x1), (min_x2, max_x2), ...].
+    max_it : int
+        Maximum number of generations.
+    sigma0 : float
+        Initial step size as a fraction of the domain width.
+    pop_size : int or None
+        Offspring per generation (default: 4 + 3 ln(dim)).
+    target : float or None
+        Stop as soon as the best value is <= target.
+    rng : np.random.Generator or None
+        Source of randomness (a fresh default_rng() when omitted).
+    vectorized : bool
+        f takes one (n, dim) array instead of separate coordinates.
+
+    Samples outside the box are clipped to it before evaluation, and the
+    clipped points are used for the update.
+    """
+
+    def __init__(self, f, domain, max_it=1000, sigma0=0.3, pop_size=None,
+                 target=None, rng=None, vectorized=False):
+        self.f = f
+        self.domain = np.array(domain, dtype=float)
+        self.max_it = max_it
+        self.sigma0 = sigma0
+        self.target = target
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.vectorized = vectorized
+
+        self.dim = len(domain)
+        self.lo, self.hi = self.domain[:, 0].copy(), self.domain[:, 1].copy()
+        self.pop_size = pop_size if pop_size is not None else 4 + int(3 * np.log(self.dim))
+
+        self.evals = 0  # objective calls spent by the last search
+
+    def _evaluate(self, X):
+        """Objective values of an (n, dim) block of points."""
+        return evaluate_block(self.f, X, self.vectorized)
+
+    def search(self):
+        """
+        Executes CMA-ES.
+
+        Returns
+        -------
+        best_x : np.ndarray
+            Best solution found.
+        best_f : float
+            Objective function value for best_x.
+        """
+        n, lam = self.dim, self.pop_size
+        mu = lam // 2
+
+        # recombination weights
+        w = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+        w /= w.sum()
+        mueff = 1.0 / np.sum(w**2)
+
+        # adaptation constants (Hansen's defaults)
+        cc = (4 + mueff / n) / (n + 4 + 2 * mueff / n)
+        cs = (mueff + 2) / (n + mueff + 5)
+        c1 = 2 / ((n + 1.3)**2 + mueff)
+        cmu = min(1 - c1, 2 * (mueff - 2 + 1 / mueff) / ((n + 2)**2 + mueff))
+        damps = 1 + 2 * max(0.0, np.sqrt((mueff - 1) / (n + 1)) - 1) + cs
+        chiN = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n**2))
+
+        # state
+        mean = self.rng.uniform(self.lo, self.hi)
+        sigma = self.sigma0 * np.max(self.hi - self.lo)
+        C = np.eye(n)
+        pc = np.zeros(n)
+        ps = np.zeros(n)
+
+        best_x, best_f = None, np.inf
+        self.evals = 0
+
+        for gen in range(self.max_it):
+
+            # SAMPLE lambda offspring: x = m + sigma * B D z
+            eigval, B = np.linalg.eigh(C)
+            Dg = np.sqrt(np.maximum(eigval, 1e-20))
+            z = self.rng.standard_normal((lam, n))
+            X = np.clip(mean + sigma * (z * Dg) @ B.T, self.lo, self.hi)
+            Y = (X - mean) / sigma
+
+            F = np.asarray(self._evaluate(X), dtype=float)
+            self.evals += lam
+
+            order = np.argsort(F)
+            if F[order[0]] < best_f:
+                best_f = F[order[0]]
+                best_x = X[order[0]].copy()
+
+            if self.target is not None and best_f <= self.target:
+                break
+
+            # RECOMBINATION
+            y_sel = Y[order[:mu]]
+            y_w = w @ y_sel
+            mean = mean + sigma * y_w
+
+            # STEP-SIZE PATH (uses C^{-1/2} y_w)
+            C_inv_sqrt_yw = B @ ((B.T @ y_w) / Dg)
+            ps = (1 - cs) * ps + np.sqrt(cs * (2 - cs) * mueff) * C_inv_sqrt_yw
+            hsig = (np.linalg.norm(ps) / np.sqrt(1 - (1 - cs)**(2 * (gen + 1))) / chiN
+                    < 1.4 + 2 / (n + 1))
+
+            # COVARIANCE PATH AND UPDATE
+            pc = (1 - cc) * pc + hsig * np.sqrt(cc * (2 - cc) * mueff) * y_w
+            rank_mu = (y_sel * w[:, None]).T @ y_sel
+            C = ((1 - c1 - cmu) * C
+                 + c1 * (np.outer(pc, pc) + (1 - hsig) * cc * (2 - cc) * C)
+                 + cmu * rank_mu)
+            C = (C + C.T) / 2
+
+            sigma *= np.exp((cs / damps) * (np.linalg.norm(ps) / chiN - 1))
+
+            if sigma * Dg.max() < 1e-12:
+                break  # converged
+
+        return best_x, best_f
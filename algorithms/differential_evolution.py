@@ -0,0 +1,101 @@
+import numpy as np
+
+from algorithms.objective import evaluate_block
+
+class DifferentialEvolution:
+    """
+    Differential Evolution (DE/rand/1/bin) for continuous optimization with
+    box constraints, vectorized over the whole population.
+
+    Parameters
+    ----------
+    f : callable
+        Objective function f(x1, x2, ...), or f(X) on an (n, dim) array of
+        points when vectorized=True. Minimization.
+    domain : list of tuples or (dim, 2) array
+        Domain of each variable [(min_x1, max_x1), (min_x2, max_x2), ...].
+    max_it : int
+        Maximum number of generations.
+    pop_size : int or None
+        Population size (default: max(10, 10 * dim), capped at 200).
+    F : float
+        Differential weight.
+    CR : float
+        Crossover probability.
+    target : float or None
+        Stop as soon as the best value is <= target.
+    rng : np.random.Generator or None
+        Source of randomness (a fresh default_rng() when omitted).
+    vectorized : bool
+        f takes one (n, dim) array instead of separate coordinates.
+    """
+
+    def __init__(self, f, domain, max_it=1000, pop_size=None, F=0.8, CR=0.9,
+                 target=None, rng=None, vectorized=False):
+        self.f = f
+        self.domain = np.array(domain, dtype=float)
+        self.max_it = max_it
+        self.F = F
+        self.CR = CR
+        self.target = target
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.vectorized = vectorized
+
+        self.dim = len(domain)
+        self.lo, self.hi = self.domain[:, 0].copy(), self.domain[:, 1].copy()
+        self.pop_size = pop_size if pop_size is not None else min(max(10, 10 * self.dim), 200)
+
+        self.evals = 0  # objective calls spent by the last search
+
+    def _evaluate(self, X):
+        """Objective values of an (n, dim) block of points."""
+        return evaluate_block(self.f, X, self.vectorized)
+
+    def _donors(self):
+        """Three distinct donor indices per individual, all different from it."""
+        n = self.pop_size
+        keys = self.rng.random((n, n))
+        keys[np.arange(n), np.arange(n)] = np.inf  # never pick yourself
+        return np.argpartition(keys, 2, axis=1)[:, :3]
+
+    def search(self):
+        """
+        Executes DE.
+
+        Returns
+        -------
+        best_x : np.ndarray
+            Best solution found.
+        best_f : float
+            Objective function value for best_x.
+        """
+        n, d = self.pop_size, self.dim
+
+        pop = self.rng.uniform(self.lo, self.hi, size=(n, d))
+        fit = np.asarray(self._evaluate(pop), dtype=float)
+        self.evals = n
+
+        for _ in range(self.max_it):
+
+            if self.target is not None and fit.min() <= self.target:
+                break
+
+            # MUTATION: v = x_r1 + F (x_r2 - x_r3)
+            r = self._donors()
+            mutant = pop[r[:, 0]] + self.F * (pop[r[:, 1]] - pop[r[:, 2]])
+            mutant = np.clip(mutant, self.lo, self.hi)
+
+            # BINOMIAL CROSSOVER (at least one coordinate from the mutant)
+            cross = self.rng.random((n, d)) < self.CR
+            cross[np.arange(n), self.rng.integers(0, d, size=n)] = True
+            trial = np.where(cross, mutant, pop)
+
+            # SELECTION
+            f_trial = self._evaluate(trial)
+            self.evals += n
+            better = f_trial <= fit
+            pop[better] = trial[better]
+            fit[better] = f_trial[better]
+
+        i = np.argmin(fit)
+        return pop[i], fit[i]
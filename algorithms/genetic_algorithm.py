@@ -1,9 +1,37 @@
 import numpy as np
-from problems.discrete.problem8_tsp import route_length
+from algorithms.local_search_tsp import TSPLocalSearch
+from algorithms.tsp_construction import seed_tours
+from problems.discrete.problem8_tsp import (MAX_MATRIX_BYTES, city_dtype, distance_matrix,
+                                            route_lengths, swap_deltas)
 
 class GeneticTSP:
     def __init__(self, points, pop_size=100, max_gen=300,
-                 tournament_k=3, mutation_prob=0.01, elitism=0):
+                 tournament_k=3, mutation_prob=0.01, elitism=0,
+                 local_search=None, ls_neighbors=8, D=None, neighbors=None,
+                 seeding=None, rng=None, evaluator=None, memo=None,
+                 max_matrix_bytes=MAX_MATRIX_BYTES):
+        """
+        local_search: None, "children" or "elites" - which individuals get
+                      2-opt/Or-opt improvement every generation (memetic GA)
+        ls_neighbors: size of the nearest-neighbour candidate lists
+        D, neighbors: precomputed distance matrix / candidate table
+                      (e.g. from load_distances); built from points if omitted
+        max_matrix_bytes: without D, the matrix is only built if it fits in
+                          this size; larger instances score routes from the
+                          coordinates (slower per edge, O(N) memory)
+        seeding: fraction of the initial population built by each
+                 constructive heuristic, e.g. {"nn": 0.2, "greedy": 0.05,
+                 "sfc": 0.05}; the rest stays random for diversity
+        rng: np.random.Generator used for every random draw
+        evaluator: utils.evaluation.AsyncEvaluator scoring one route with a
+                   black-box objective; replaces the route length. Each
+                   generation is submitted concurrently, and since no O(1)
+                   swap deltas exist for a black box, mutated and locally
+                   improved individuals are re-scored in full
+        memo: utils.memo.MemoCache; duplicate routes (common once the
+              population converges) are then looked up instead of
+              re-scored. Pays off with expensive objectives (evaluator)
+        """
 
         self.points = points
         self.pop_size = pop_size
@@ -11,115 +39,261 @@ class GeneticTSP:
         self.tournament_k = tournament_k
         self.mutation_prob = mutation_prob
         self.elitism = elitism
+        self.local_search = local_search
+        self.seeding = seeding or {}
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.evaluator = evaluator
+        self.memo = memo
 
         self.N = len(points)  # number of cities
+        # built once, reused by every evaluation (None: too large, edges
+        # are then computed from the coordinates)
+        if D is None and self.N * self.N * 8 <= max_matrix_bytes:
+            D = distance_matrix(points)
+        self.D = D
+        self.pts = np.asarray(points, dtype=float)
+        self.dtype = city_dtype(self.N)   # compact storage for city indices
+
+        # double-buffered population storage: one generation is read from
+        # while the next is written into, then the two swap roles
+        self._pops = np.empty((2, pop_size, self.N), dtype=self.dtype)
+        self._costs = np.empty((2, pop_size), dtype=float)
+        self._parents = np.empty((2, pop_size, self.N), dtype=self.dtype)
+
+        self.ls = None
+        if local_search is not None:
+            self.ls = TSPLocalSearch(points, k=ls_neighbors, neighbors=neighbors)
+
+        # evaluation counters (full route scorings vs O(1) swap updates)
+        self.full_evals = 0
+        self.delta_evals = 0
 
     # -----------------------------------------------------
     # INITIAL POPULATION
     # -----------------------------------------------------
 
     def generate_population(self):
-        pop = []
-        for _ in range(self.pop_size):
-            ind = np.random.permutation(self.N)
-            pop.append(ind)
-        return np.array(pop, dtype=int)
+        pop = np.empty((self.pop_size, self.N), dtype=self.dtype)
+
+        # constructive seeds first (see tsp_construction.seed_tours)
+        row = 0
+        for strategy, fraction in self.seeding.items():
+            n = min(int(round(fraction * self.pop_size)), self.pop_size - row)
+            pop[row:row + n] = seed_tours(strategy, n, self.D, self.points, self.rng)
+            row += n
+
+        for r in range(row, self.pop_size):
+            pop[r] = self.rng.permutation(self.N)
+        return pop
 
     # -----------------------------------------------------
     # FITNESS
     # -----------------------------------------------------
 
-    def fitness(self, individual):
-        return 1.0 / route_length(individual, self.points)
+    def cost(self, individual):
+        """Route length of a single individual (one full evaluation)."""
+        return self.population_costs(np.asarray(individual)[None, :])[0]
+
+    def population_costs(self, pop):
+        """Route lengths of the whole population in one vectorized pass."""
+        if self.memo is not None:
+            return self.memo.batch(pop, self._score)
+        return self._score(pop)
+
+    def _score(self, pop):
+        """Full evaluation of every row of pop (no cache)."""
+        self.full_evals += len(pop)
+        if self.evaluator is not None:
+            return self.evaluator.evaluate(pop)
+        return route_lengths(pop, self.D, self.pts)
 
     # -----------------------------------------------------
     # TOURNAMENT SELECTION
     # -----------------------------------------------------
 
-    def tournament(self, pop):
-        selected = np.random.choice(len(pop), self.tournament_k, replace=False)
-        best = None
-        best_fit = -np.inf
-        for idx in selected:
-            f = self.fitness(pop[idx])
-            if f > best_fit:
-                best = pop[idx]
-                best_fit = f
-        return best.copy()
+    def tournament(self, costs, n):
+        """
+        Run n tournaments at once and return the indices of the winners.
+        Contestants are drawn as an (n, k) index matrix, k distinct per row,
+        with Floyd's sampling algorithm run on all rows at once (O(n k^2),
+        independent of pop_size and never retried, even for k = pop_size);
+        the winner is the argmin over their cached costs.
+        """
+        P = len(costs)
+        k = min(self.tournament_k, P)
+
+        contestants = np.empty((n, k), dtype=np.int64)
+        for c, j in enumerate(range(P - k, P)):
+            t = self.rng.integers(0, j + 1, n)
+            taken = np.any(contestants[:, :c] == t[:, None], axis=1)
+            contestants[:, c] = np.where(taken, j, t)
+
+        winner = np.argmin(costs[contestants], axis=1)
+        return contestants[np.arange(n), winner]
 
     # -----------------------------------------------------
     # 2-POINT ORDERED CROSSOVER (NO REPETITION)
     # -----------------------------------------------------
 
-    def crossover(self, parent1, parent2):
-        N = self.N
-        a, b = np.sort(np.random.choice(N, 2, replace=False))
-        
-        child = -np.ones(N, dtype=int)
-        child[a:b] = parent1[a:b]
-
-        fill = [gene for gene in parent2 if gene not in child]
-        fill_idx = [i for i in range(N) if child[i] == -1]
+    def crossover(self, parents1, parents2, out=None):
+        """
+        Ordered crossover for a whole batch of parent pairs, shape (n, N).
+        Each child keeps parent1[a:b] in place and fills the remaining
+        positions with parent2's genes in parent2's order.
+        Children are written into `out` when given.
+        """
+        n, N = parents1.shape
+        cuts = np.sort(np.argpartition(self.rng.random((n, N)), 1, axis=1)[:, :2], axis=1)
+        pos = np.arange(N)
+        segment = (pos >= cuts[:, :1]) & (pos < cuts[:, 1:])
 
-        for idx, gene in zip(fill_idx, fill):
-            child[idx] = gene
+        # genes already placed by parent1, indexed by city
+        taken = np.zeros((n, N), dtype=bool)
+        np.put_along_axis(taken, parents1, segment, axis=1)
+        fill = ~np.take_along_axis(taken, parents2, axis=1)
 
-        return child
+        # both masks hold N - (b - a) entries per row, so rows line up
+        children = np.empty_like(parents1) if out is None else out
+        children[segment] = parents1[segment]
+        children[~segment] = parents2[fill]
+        return children
 
     # -----------------------------------------------------
     # SWAP MUTATION (1% probability)
     # -----------------------------------------------------
 
-    def mutate(self, individual):
-        if np.random.rand() < self.mutation_prob:
-            i, j = np.random.choice(self.N, 2, replace=False)
-            individual[i], individual[j] = individual[j], individual[i]
+    def mutate(self, children, costs=None):
+        """
+        Swap two cities in each selected child (in place) and update
+        their costs by the delta over the affected edges only
+        (costs=None: only swap, the caller re-scores the children).
+        """
+        rows = np.flatnonzero(self.rng.random(len(children)) < self.mutation_prob)
+        if len(rows) == 0:
+            return costs
+
+        pairs = np.argpartition(self.rng.random((len(rows), self.N)), 1, axis=1)[:, :2]
+        i, j = pairs[:, 0], pairs[:, 1]
+
+        if costs is not None:
+            costs[rows] += swap_deltas(children[rows], i, j, self.D, self.pts)
+            self.delta_evals += len(rows)
+        children[rows, i], children[rows, j] = children[rows, j], children[rows, i]
+        return costs
 
     # -----------------------------------------------------
-    # MAIN LOOP
+    # LOCAL IMPROVEMENT (memetic stage)
     # -----------------------------------------------------
 
-    def run(self, acceptable_cost=None):
-        """
-        acceptable_cost: stopping condition (slide 31/61)
-        """
-        pop = self.generate_population()
-        best_ind = None
-        best_fit = -np.inf
+    def improve(self, pop, costs):
+        """Apply 2-opt/Or-opt to every row of pop in place, updating costs."""
+        for r in range(len(pop)):
+            pop[r], delta = self.ls.improve(pop[r])
+            costs[r] += delta
 
-        for gen in range(self.max_gen):
+        if self.evaluator is not None:
+            # the moves were chosen on distances; the black box decides
+            costs[:] = self.population_costs(pop)
 
-            # Evaluate population
-            fits = np.array([self.fitness(ind) for ind in pop])
-            idx_best = np.argmax(fits)
+    # -----------------------------------------------------
+    # GENERATION STEP
+    # -----------------------------------------------------
 
-            if fits[idx_best] > best_fit:
-                best_fit = fits[idx_best]
-                best_ind = pop[idx_best].copy()
+    @property
+    def population(self):
+        """Current generation (a view into the active buffer)."""
+        return self._pops[self._cur]
 
-            # STOP if acceptable route length reached
-            cost = 1.0 / best_fit
-            if acceptable_cost is not None and cost <= acceptable_cost:
-                return best_ind, gen
+    @property
+    def costs(self):
+        """Cached route lengths of the current generation."""
+        return self._costs[self._cur]
+
+    def initialize(self):
+        """Create and score the initial population, reset the best-so-far."""
+        self._cur = 0
+        self.population[:] = self.generate_population()
+        self.costs[:] = self.population_costs(self.population)
+
+        if self.local_search == "children":
+            self.improve(self.population, self.costs)
+
+        self.best_ind = None
+        self.best_cost = np.inf
+        self._update_best()
+
+    def _update_best(self):
+        idx_best = np.argmin(self.costs)
+        if self.costs[idx_best] < self.best_cost:
+            self.best_cost = self.costs[idx_best]
+            self.best_ind = self.population[idx_best].copy()
+
+    def evolve(self):
+        """Produce the next generation into the idle buffer, then swap."""
+        pop, costs = self.population, self.costs
+        nxt = 1 - self._cur
+        new_pop, new_costs = self._pops[nxt], self._costs[nxt]
+
+        # ELITISM (elites keep their cached cost)
+        e = self.elitism
+        elite_indices = np.argsort(costs)[:e]
+        new_pop[:e] = pop[elite_indices]
+        new_costs[:e] = costs[elite_indices]
+
+        # GENERATE NEW POP (whole offspring batch at once)
+        n_children = self.pop_size - e
+        p1 = np.take(pop, self.tournament(costs, n_children), axis=0, out=self._parents[0, :n_children])
+        p2 = np.take(pop, self.tournament(costs, n_children), axis=0, out=self._parents[1, :n_children])
+
+        children = self.crossover(p1, p2, out=new_pop[e:])
+        if self.evaluator is None:
+            new_costs[e:] = self.population_costs(children)
+            self.mutate(children, new_costs[e:])
+        else:
+            # black-box objective: no deltas, score each child once after mutation
+            self.mutate(children)
+            new_costs[e:] = self.population_costs(children)
+
+        if self.local_search == "children":
+            self.improve(children, new_costs[e:])
+        elif self.local_search == "elites":
+            self.improve(new_pop[:e], new_costs[:e])
+
+        self._cur = nxt
+        self._update_best()
 
-            # ELITISM
-            elites = []
-            if self.elitism > 0:
-                elite_indices = np.argsort(fits)[-self.elitism:]
-                elites = [pop[i].copy() for i in elite_indices]
+    # -----------------------------------------------------
+    # MIGRATION (used by the island model)
+    # -----------------------------------------------------
 
-            # GENERATE NEW POP
-            new_pop = elites.copy()
+    def emigrants(self, count):
+        """Copies of the `count` best individuals and their costs."""
+        idx = np.argsort(self.costs)[:count]
+        return self.population[idx].copy(), self.costs[idx].copy()
 
-            while len(new_pop) < self.pop_size:
-                p1 = self.tournament(pop)
-                p2 = self.tournament(pop)
+    def immigrate(self, individuals, costs):
+        """Replace the worst individuals with incoming migrants."""
+        idx = np.argsort(self.costs)[len(self.costs) - len(individuals):]
+        self.population[idx] = individuals
+        self.costs[idx] = costs
+        self._update_best()
 
-                child = self.crossover(p1, p2)
-                self.mutate(child)
-                new_pop.append(child)
+    # -----------------------------------------------------
+    # MAIN LOOP
+    # -----------------------------------------------------
 
-            pop = np.array(new_pop, dtype=int)
+    def run(self, acceptable_cost=None):
+        """
+        acceptable_cost: stopping condition (slide 31/61)
+        """
+        self.initialize()
+
+        for gen in range(self.max_gen):
+
+            # STOP if acceptable route length reached
+            if acceptable_cost is not None and self.best_cost <= acceptable_cost:
+                return self.best_ind, gen
 
-        return best_ind, self.max_gen
+            self.evolve()
 
+        return self.best_ind, self.max_gen
@@ -1,62 +1,148 @@
 import numpy as np
 
+from algorithms.objective import evaluate_block, evaluate_point
+
 class GlobalRandomSearch:
     """
     Global Random Search for continuous optimization.
 
     Signature:
-        GlobalRandomSearch(f, domain, sigma=0.4, max_it=1000)
+        GlobalRandomSearch(f, domain, sigma=0.4, max_it=1000, rng=None, block=4096,
+                           vectorized=False, evaluator=None)
 
     Parameters
     ----------
     f : callable
-        Objective function f(x1, x2, ...)
-    domain : list of tuples
+        Objective function f(x1, x2, ...). It must accept arrays (all
+        problems in problems/continuous do), since whole blocks of samples
+        are evaluated with one call f(*X.T).
+    domain : list of tuples or (dim, 2) array
         [(x1_min, x1_max), (x2_min, x2_max), ...]
     sigma : float
         (Optional) used only if you later wish to create 'local candidate around global sample'.
         For plain GRS it's not necessary but kept to match LRS signature.
     max_it : int
-        Maximum iterations.
+        Sample budget (number of uniform samples after the initial one).
+    rng : np.random.Generator or None
+        Source of randomness (a fresh default_rng() when omitted).
+    block : int
+        Samples drawn and evaluated per vectorized call. Only one block is
+        held in memory at a time, so large budgets (10^8+) stay bounded.
+    vectorized : bool
+        f takes one (n, dim) array of points instead of separate
+        coordinates (see problems.continuous.registry).
+    evaluator : utils.evaluation.AsyncEvaluator or None
+        Black-box objective of one point, evaluated concurrently (f is then
+        unused). search() streams the samples through it and updates the
+        best as results arrive.
     """
 
-    def __init__(self, f, domain, sigma=0.4, max_it=1000):
+    def __init__(self, f, domain, sigma=0.4, max_it=1000, rng=None, block=4096,
+                 vectorized=False, evaluator=None):
         self.f = f
         self.domain = np.array(domain, dtype=float)
         self.sigma = sigma
         self.max_it = max_it
         self.dim = len(domain)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.block = block
+        self.vectorized = vectorized
+        self.evaluator = evaluator
+        self.lo, self.hi = self.domain[:, 0].copy(), self.domain[:, 1].copy()
 
-    def _sample_uniform(self):
-        """Sample uniformly in the domain box."""
-        x = np.empty(self.dim, dtype=float)
-        for i in range(self.dim):
-            lo, hi = self.domain[i]
-            x[i] = np.random.uniform(lo, hi)
-        return x
+    def _sample_uniform(self, n=None):
+        """Sample uniformly in the domain box: one point, or an (n, dim) block."""
+        size = self.dim if n is None else (n, self.dim)
+        return self.rng.uniform(self.lo, self.hi, size=size)
 
     def _clip(self, x):
-        for i in range(self.dim):
-            x[i] = np.clip(x[i], self.domain[i][0], self.domain[i][1])
-        return x
+        return np.clip(x, self.lo, self.hi)
+
+    def _evaluate(self, X):
+        """Objective values of an (n, dim) block of points."""
+        return evaluate_block(self.f, X, self.vectorized, self.evaluator)
+
+    def _evaluate_one(self, x):
+        """Objective value of a single point."""
+        return evaluate_point(self.f, x, self.vectorized, self.evaluator)
 
     def search(self):
         """
         Runs plain Global Random Search:
-        - sample uniformly max_it times
-        - keep best found
+        - sample uniformly max_it times, in blocks of `block` points
+        - keep best found (streaming reduction over the blocks)
         Returns (best_x, best_f)
         """
+        if self.evaluator is not None:
+            return self._search_async()
 
         # initial best: sample once
         best_x = self._sample_uniform()
-        best_f = self.f(*best_x)
-
-        for _ in range(self.max_it):
-            x_cand = self._sample_uniform()
-            f_cand = self.f(*x_cand)
-            if f_cand < best_f:   # default: minimization
-                best_x = x_cand
-                best_f = f_cand
+        best_f = self._evaluate_one(best_x)
+
+        remaining = self.max_it
+        while remaining > 0:
+            n = min(self.block, remaining)
+            remaining -= n
+
+            X = self._sample_uniform(n)
+            F = self._evaluate(X)
+
+            i = np.argmin(F)
+            if F[i] < best_f:   # default: minimization
+                best_x = X[i]
+                best_f = F[i]
+
+        return best_x, best_f
+
+    def _search_async(self):
+        """
+        GRS over a black-box evaluator: the 1 + max_it samples are drawn
+        lazily, at most max_in_flight are pending at once, and the best is
+        updated in whatever order the results come back.
+        """
+        pending = {}  # sample index -> point, until its value arrives
+
+        def samples():
+            for i in range(self.max_it + 1):
+                pending[i] = self._sample_uniform()
+                yield pending[i]
+
+        best_x, best_f = None, np.inf
+        for i, value in self.evaluator.as_completed(samples()):
+            x = pending.pop(i)
+            if value < best_f:   # default: minimization
+                best_x = x
+                best_f = value
+
+        return best_x, best_f
+
+    def search_batch(self, n_runs):
+        """
+        n_runs independent GRS runs at once. Each step samples an
+        (n_runs, b, dim) block, b = block // n_runs points per run, and
+        evaluates it with a single vectorized objective call.
+        Returns (best_x, best_f) of shapes (n_runs, dim) and (n_runs,).
+        """
+        rows = np.arange(n_runs)
+
+        best_x = self._sample_uniform(n_runs)
+        best_f = np.asarray(self._evaluate(best_x), dtype=float).copy()
+
+        per_run = max(1, self.block // n_runs)
+        remaining = self.max_it
+        while remaining > 0:
+            b = min(per_run, remaining)
+            remaining -= b
+
+            X = self._sample_uniform(n_runs * b)
+            F = self._evaluate(X).reshape(n_runs, b)
+            X = X.reshape(n_runs, b, self.dim)
+
+            i = np.argmin(F, axis=1)
+            f_cand = F[rows, i]
+            better = f_cand < best_f   # default: minimization
+            best_x[better] = X[rows, i][better]
+            best_f[better] = f_cand[better]
 
         return best_x, best_f
@@ -1,5 +1,7 @@
 import numpy as np
 
+from algorithms.objective import evaluate_block, evaluate_point
+
 class HillClimbing:
     """
     Generic Hill Climbing optimizer for continuous functions with box constraints.
@@ -7,8 +9,9 @@ class HillClimbing:
     Parameters
     ----------
     f : callable
-        Objective function f(x) where x is a numpy array.
-    domain : list of tuples
+        Objective function f(x1, x2, ...), or f(X) on an (n, dim) array of
+        points when vectorized=True.
+    domain : list of tuples or (dim, 2) array
         Domain of each variable [(min_x1, max_x1), (min_x2, max_x2), ...].
     eps : float
         Neighborhood radius. Candidate points are generated as x_new = x + uniform(-eps, eps).
@@ -16,29 +19,65 @@ class HillClimbing:
         Maximum number of iterations per run (default: 1000).
     patience : int
         Early stopping after 'patience' iterations without improvement.
+    rng : np.random.Generator or None
+        Source of randomness (a fresh default_rng() when omitted).
+    vectorized : bool
+        f takes one (n, dim) array instead of separate coordinates
+        (see problems.continuous.registry); needed for large dim.
+    n_neighbors : int
+        K > 1 switches to steepest-ascent mode: K neighbours are sampled
+        around the incumbent, evaluated in one vectorized call, and the
+        search moves to the best of them if it improves.
+    max_evals : int or None
+        Objective-call budget of the steepest-ascent mode (default: max_it,
+        i.e. the same number of evaluations as the one-candidate mode).
+    evaluator : utils.evaluation.AsyncEvaluator or None
+        Black-box objective of one point, evaluated concurrently (f is then
+        unused). The K neighbours of a steepest-ascent step are submitted
+        together, so their latencies overlap.
     """
 
-    def __init__(self, f, domain, eps=0.1, max_it=1000, patience=50):
+    def __init__(self, f, domain, eps=0.1, max_it=1000, patience=50, rng=None,
+                 vectorized=False, n_neighbors=1, max_evals=None, evaluator=None):
         self.f = f
         self.domain = np.array(domain, dtype=float)
         self.eps = eps
         self.max_it = max_it
         self.patience = patience
-        
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.vectorized = vectorized
+        self.n_neighbors = n_neighbors
+        self.max_evals = max_it if max_evals is None else max_evals
+        self.evaluator = evaluator
+
+        self.evals = 0  # objective calls spent by the last search
+
         self.dim = len(domain)
+        self.lo, self.hi = self.domain[:, 0].copy(), self.domain[:, 1].copy()
 
     def _clip_to_domain(self, x):
         """Ensure candidate stays within given bounds (box constraints)."""
-        for i in range(self.dim):
-            x[i] = np.clip(x[i], self.domain[i][0], self.domain[i][1])
-        return x
+        return np.clip(x, self.lo, self.hi)
+
+    def _evaluate(self, X):
+        """Objective values of an (n, dim) block of points."""
+        return evaluate_block(self.f, X, self.vectorized, self.evaluator)
+
+    def _evaluate_one(self, x):
+        """Objective value of a single point."""
+        return evaluate_point(self.f, x, self.vectorized, self.evaluator)
 
     def _neighbor(self, x):
         """Generate a neighbor within ε distance."""
-        noise = np.random.uniform(-self.eps, self.eps, size=self.dim)
+        noise = self.rng.uniform(-self.eps, self.eps, size=self.dim)
         x_new = x + noise
         return self._clip_to_domain(x_new)
 
+    def _neighbors(self, x, K):
+        """Generate K neighbors within ε distance, as a (K, dim) array."""
+        noise = self.rng.uniform(-self.eps, self.eps, size=(K, self.dim))
+        return self._clip_to_domain(x + noise)
+
     def search(self):
         """
         Executes the Hill Climbing search.
@@ -50,18 +89,21 @@ class HillClimbing:
         best_f : float
             Objective function value for best_x.
         """
+        if self.n_neighbors > 1:
+            return self._search_steepest()
 
         # Start at lower bound of domain (as required by professor)
-        x = np.array([self.domain[i][0] for i in range(self.dim)], dtype=float)
-        best_x = x.copy()
-        best_f = self.f(*best_x)
+        best_x = self.lo.copy()
+        best_f = self._evaluate_one(best_x)
+        self.evals = 1
 
         no_improvement_steps = 0
 
         for it in range(self.max_it):
 
             x_cand = self._neighbor(best_x)
-            f_cand = self.f(*x_cand)
+            f_cand = self._evaluate_one(x_cand)
+            self.evals += 1
 
             if f_cand < best_f:       # MINIMIZATION
                 best_x = x_cand
@@ -75,3 +117,129 @@ class HillClimbing:
                 break
 
         return best_x, best_f
+
+    def _search_steepest(self):
+        """
+        Steepest-ascent Hill Climbing over K sampled neighbours per step.
+        The budget is counted in objective calls (max_evals); patience
+        counts steps in which none of the K neighbours improved.
+        """
+
+        # Start at lower bound of domain (as required by professor)
+        best_x = self.lo.copy()
+        best_f = self._evaluate_one(best_x)
+        self.evals = 1
+
+        no_improvement_steps = 0
+
+        while self.evals < self.max_evals:
+
+            K = min(self.n_neighbors, self.max_evals - self.evals)
+            X = self._neighbors(best_x, K)
+            F = self._evaluate(X)
+            self.evals += K
+
+            i = np.argmin(F)
+            if F[i] < best_f:       # MINIMIZATION
+                best_x = X[i]
+                best_f = F[i]
+                no_improvement_steps = 0
+            else:
+                no_improvement_steps += 1
+
+            # Early stopping (patience)
+            if no_improvement_steps > self.patience:
+                break
+
+        return best_x, best_f
+
+    def search_batch(self, n_runs):
+        """
+        Executes n_runs independent Hill Climbing runs at once.
+
+        All runs advance together as one (n_runs, dim) array, with a single
+        vectorized objective call per iteration. Each run keeps its own
+        patience counter and freezes once it stops early. With n_neighbors
+        K > 1 every run takes steepest-ascent steps over K neighbours under
+        the max_evals budget, as in search().
+
+        Returns
+        -------
+        best_x : np.ndarray
+            (n_runs, dim) best solution of every run.
+        best_f : np.ndarray
+            (n_runs,) objective values of best_x.
+        """
+        if self.n_neighbors > 1:
+            return self._search_batch_steepest(n_runs)
+
+        # Start at lower bound of domain (as required by professor)
+        best_x = np.tile(self.lo, (n_runs, 1))
+        best_f = np.asarray(self._evaluate(best_x), dtype=float).copy()
+        self.evals = n_runs
+
+        no_improvement_steps = np.zeros(n_runs, dtype=int)
+        active = np.arange(n_runs)
+
+        for it in range(self.max_it):
+
+            noise = self.rng.uniform(-self.eps, self.eps, size=(len(active), self.dim))
+            x_cand = self._clip_to_domain(best_x[active] + noise)
+            f_cand = self._evaluate(x_cand)
+            self.evals += len(active)
+
+            better = f_cand < best_f[active]       # MINIMIZATION
+            improved = active[better]
+            best_x[improved] = x_cand[better]
+            best_f[improved] = f_cand[better]
+            no_improvement_steps[improved] = 0
+            no_improvement_steps[active[~better]] += 1
+
+            # Early stopping (patience), per run
+            active = active[no_improvement_steps[active] <= self.patience]
+            if len(active) == 0:
+                break
+
+        return best_x, best_f
+
+    def _search_batch_steepest(self, n_runs):
+        """
+        search_batch in steepest-ascent mode: every active run samples K
+        neighbours per step, all (runs x K) points are evaluated in one
+        call, and each run moves to its best neighbour if it improves.
+        Every active run spends the same calls per step, so max_evals is
+        counted once for all of them.
+        """
+        # Start at lower bound of domain (as required by professor)
+        best_x = np.tile(self.lo, (n_runs, 1))
+        best_f = np.asarray(self._evaluate(best_x), dtype=float).copy()
+        self.evals = n_runs
+        spent = 1  # objective calls per run
+
+        no_improvement_steps = np.zeros(n_runs, dtype=int)
+        active = np.arange(n_runs)
+
+        while spent < self.max_evals and len(active) > 0:
+
+            K = min(self.n_neighbors, self.max_evals - spent)
+            noise = self.rng.uniform(-self.eps, self.eps, size=(len(active), K, self.dim))
+            X = self._clip_to_domain(best_x[active, None, :] + noise)
+            F = np.asarray(self._evaluate(X.reshape(-1, self.dim)), dtype=float)
+            F = F.reshape(len(active), K)
+            self.evals += len(active) * K
+            spent += K
+
+            i = np.argmin(F, axis=1)
+            f_cand = F[np.arange(len(active)), i]
+
+            better = f_cand < best_f[active]       # MINIMIZATION
+            improved = active[better]
+            best_x[improved] = X[better, i[better]]
+            best_f[improved] = f_cand[better]
+            no_improvement_steps[improved] = 0
+            no_improvement_steps[active[~better]] += 1
+
+            # Early stopping (patience), per run
+            active = active[no_improvement_steps[active] <= self.patience]
+
+        return best_x, best_f
@@ -0,0 +1,169 @@
+import multiprocessing as mp
+import queue
+import time
+
+import numpy as np
+from algorithms.genetic_algorithm import GeneticTSP
+from problems.discrete.problem8_tsp import MAX_MATRIX_BYTES, distance_matrix
+from utils.shared import SharedArrays, attach_shared, shared_array
+
+
+def _island_worker(island, handles, ga_kwargs, seed, migration_interval,
+                   migration_count, acceptable_cost, inbox, outbox, stop, results):
+    """
+    Evolve one sub-population in its own process.
+    Every `migration_interval` generations the island sends copies of its
+    best individuals to the next island of the ring and replaces its worst
+    individuals with the migrants received from the previous one.
+    """
+    start = time.time()
+
+    # points and distance data are shared by all islands (read-only, zero-copy)
+    attach_shared(handles)
+    shared = {key: shared_array(key) for key in handles if key != "points"}
+
+    # every island draws from its own random stream
+    ga = GeneticTSP(shared_array("points"), rng=np.random.default_rng(seed), **shared, **ga_kwargs)
+    ga.initialize()
+
+    gen = 0
+    received = 0
+    while gen < ga.max_gen and not stop.is_set():
+
+        if acceptable_cost is not None and ga.best_cost <= acceptable_cost:
+            stop.set()  # the other islands can stop as well
+            break
+
+        ga.evolve()
+        gen += 1
+
+        # MIGRATION over the ring (skipped after the last generation)
+        if gen % migration_interval == 0 and gen < ga.max_gen:
+            outbox.put(ga.emigrants(migration_count))
+
+            migrants = None
+            while migrants is None and not stop.is_set():
+                try:
+                    migrants = inbox.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+            if migrants is not None:
+                ga.immigrate(*migrants)
+                received += len(migrants[0])
+
+    results.put({
+        "island": island,
+        "best_ind": ga.best_ind,
+        "best_cost": float(ga.best_cost),
+        "generations": gen,
+        "migrants_received": received,
+        "full_evals": ga.full_evals,
+        "delta_evals": ga.delta_evals,
+        "time": time.time() - start,
+    })
+
+
+class IslandGeneticTSP:
+    """
+    Island-model GeneticTSP: several sub-populations evolve in separate
+    processes and periodically exchange their best individuals over a ring.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        (N, 3) city coordinates.
+    n_islands : int
+        Number of sub-populations (one worker process each).
+    migration_interval : int
+        Generations between two migrations.
+    migration_count : int
+        Individuals sent to the next island at each migration.
+    seed : int or None
+        Master seed; each island receives an independent child seed.
+    D, neighbors : np.ndarray or None
+        Precomputed distance matrix / candidate table, shared by all
+        islands. Without D the matrix is built (and shared) only if it fits
+        in max_matrix_bytes, as in GeneticTSP; otherwise routes are scored
+        from the coordinates.
+    **ga_kwargs
+        Forwarded to GeneticTSP (pop_size, max_gen, tournament_k, ...).
+        rng is not accepted: every island gets its own stream from seed.
+    """
+
+    def __init__(self, points, n_islands=4, migration_interval=20,
+                 migration_count=2, seed=None, D=None, neighbors=None, **ga_kwargs):
+        if "rng" in ga_kwargs:
+            raise TypeError("IslandGeneticTSP seeds every island itself: pass seed, not rng")
+
+        self.points = points
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migration_count = migration_count
+        self.seed = seed
+        self.D = D
+        self.neighbors = neighbors
+        self.ga_kwargs = ga_kwargs
+
+    def run(self, acceptable_cost=None):
+        """
+        Run all islands until max_gen (or until one reaches acceptable_cost).
+
+        Returns
+        -------
+        best_ind : np.ndarray
+            Best route found by any island.
+        best_cost : float
+            Its route length.
+        stats : list of dict
+            Per-island statistics, ordered by island index.
+        """
+        seeds = np.random.SeedSequence(self.seed).spawn(self.n_islands)
+
+        inboxes = [mp.Queue() for _ in range(self.n_islands)]
+        results = mp.Queue()
+        stop = mp.Event()
+
+        arrays = dict(points=self.points)
+        N = len(self.points)
+        if self.D is not None:
+            arrays["D"] = self.D
+        elif N * N * 8 <= self.ga_kwargs.get("max_matrix_bytes", MAX_MATRIX_BYTES):
+            arrays["D"] = distance_matrix(self.points)
+        if self.neighbors is not None:
+            arrays["neighbors"] = self.neighbors
+
+        with SharedArrays(**arrays) as shared:
+            workers = []
+            for i in range(self.n_islands):
+                outbox = inboxes[(i + 1) % self.n_islands]  # ring topology
+                w = mp.Process(
+                    target=_island_worker,
+                    args=(i, shared.handles, self.ga_kwargs, seeds[i],
+                          self.migration_interval, self.migration_count,
+                          acceptable_cost, inboxes[i], outbox, stop, results),
+                )
+                w.start()
+                workers.append(w)
+
+            stats = [results.get() for _ in workers]
+
+            # migrants sent to an island that already stopped are never read;
+            # drain them so the senders can flush their queues and exit
+            for inbox in inboxes:
+                while True:
+                    try:
+                        inbox.get_nowait()
+                    except queue.Empty:
+                        break
+            for w in workers:
+                w.join()
+
+        stats.sort(key=lambda s: s["island"])
+        best = min(stats, key=lambda s: s["best_cost"])
+        best_ind = best["best_ind"]
+
+        for s in stats:
+            del s["best_ind"]
+
+        return best_ind, best["best_cost"], stats
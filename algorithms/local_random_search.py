@@ -1,44 +1,77 @@
 import numpy as np
 
+from algorithms.objective import evaluate_block, evaluate_point
+
 class LocalRandomSearch:
     """
     Local Random Search for continuous optimization.
     
     sigma defines the size of the local neighborhood.
+    rng is the np.random.Generator used for the steps (fresh one if omitted).
+    vectorized=True means f takes one (n, dim) array of points instead of
+    separate coordinates (see problems.continuous.registry).
     """
 
-    def __init__(self, f, domain, sigma=0.4, max_it=1000):
+    def __init__(self, f, domain, sigma=0.4, max_it=1000, rng=None, vectorized=False):
         self.f = f
         self.domain = np.array(domain, dtype=float)
         self.sigma = sigma
         self.max_it = max_it
         self.dim = len(domain)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.vectorized = vectorized
+        self.lo, self.hi = self.domain[:, 0].copy(), self.domain[:, 1].copy()
 
     def _clip(self, x):
         """Keeps x inside the domain box."""
-        for i in range(self.dim):
-            x[i] = np.clip(x[i], self.domain[i][0], self.domain[i][1])
-        return x
+        return np.clip(x, self.lo, self.hi)
+
+    def _evaluate(self, X):
+        """Objective values of an (n, dim) block of points."""
+        return evaluate_block(self.f, X, self.vectorized)
+
+    def _evaluate_one(self, x):
+        """Objective value of a single point."""
+        return evaluate_point(self.f, x, self.vectorized)
 
     def _neighbor(self, x):
         """Generate local random point within sigma distance."""
-        step = np.random.normal(0, self.sigma, size=self.dim)
+        step = self.rng.normal(0, self.sigma, size=self.dim)
         candidate = x + step
         return self._clip(candidate)
 
     def search(self):
         """Standard LRS process."""
         # Start in the lower bound (like hill climbing)
-        x = np.array([d[0] for d in self.domain], dtype=float)
-        best_x = x.copy()
-        best_f = self.f(*best_x)
+        best_x = self.lo.copy()
+        best_f = self._evaluate_one(best_x)
 
         for _ in range(self.max_it):
             candidate = self._neighbor(best_x)
-            value = self.f(*candidate)
+            value = self._evaluate_one(candidate)
 
             if value < best_f:  # LRS is MINIMIZATION by default
                 best_x = candidate
                 best_f = value
 
         return best_x, best_f
+
+    def search_batch(self, n_runs):
+        """
+        n_runs independent LRS runs advanced together as one (n_runs, dim)
+        array, with a single vectorized objective call per iteration.
+        Returns (best_x, best_f) of shapes (n_runs, dim) and (n_runs,).
+        """
+        best_x = np.tile(self.lo, (n_runs, 1))
+        best_f = np.asarray(self._evaluate(best_x), dtype=float).copy()
+
+        for _ in range(self.max_it):
+            step = self.rng.normal(0, self.sigma, size=(n_runs, self.dim))
+            candidate = self._clip(best_x + step)
+            value = self._evaluate(candidate)
+
+            better = value < best_f  # LRS is MINIMIZATION by default
+            best_x[better] = candidate[better]
+            best_f[better] = value[better]
+
+        return best_x, best_f
@@ -0,0 +1,199 @@
+import math
+from collections import deque
+
+import numpy as np
+from problems.discrete.problem8_tsp import nearest_neighbors
+
+
+class TSPLocalSearch:
+    """
+    2-opt + Or-opt local search for the TSP (used as the memetic stage of GeneticTSP).
+
+    Moves are only tried against each city's k nearest neighbours, every move
+    is scored by an O(1) delta over the edges it changes, and don't-look bits
+    keep the search focused on cities whose surroundings changed recently.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        (N, 3) city coordinates.
+    k : int
+        Size of the candidate (nearest neighbour) list of each city.
+    max_segment : int
+        Longest segment relocated by Or-opt.
+    neighbors : np.ndarray or None
+        Precomputed (N, k) candidate table; built from `points` when omitted.
+    """
+
+    def __init__(self, points, k=8, max_segment=3, neighbors=None):
+        self.pts = [tuple(p) for p in np.asarray(points, dtype=float)]
+        self.N = len(self.pts)
+        self.max_segment = max_segment
+
+        if neighbors is None:
+            neighbors = nearest_neighbors(points, k)
+        self.neighbors = np.asarray(neighbors).tolist()
+
+        self.moves = 0  # improving moves applied so far
+
+    def _d(self, a, b):
+        return math.dist(self.pts[a], self.pts[b])
+
+    # -----------------------------------------------------
+    # ROUTE MANIPULATION
+    # -----------------------------------------------------
+
+    def _reverse(self, route, pos, i, j):
+        """Reverse the cyclic segment going forward from position i to j."""
+        if i > j:
+            # reversing a wrapping segment is the same as reversing the rest
+            i, j = j + 1, i - 1
+            if i > j:
+                return
+        route[i:j + 1] = route[i:j + 1][::-1]
+        for p in range(i, j + 1):
+            pos[route[p]] = p
+
+    def _move_segment(self, route, pos, s1, s2, u, reverse):
+        """Move the segment s1..s2 (forward) between u and its successor."""
+        N = self.N
+        i, j = pos[s1], pos[s2]
+        L = (j - i) % N + 1
+
+        segment = [route[(i + t) % N] for t in range(L)]
+        rest = [route[(j + 1 + t) % N] for t in range(N - L)]
+        if reverse:
+            segment.reverse()
+
+        at = rest.index(u) + 1
+        route[:] = rest[:at] + segment + rest[at:]
+        for p, c in enumerate(route):
+            pos[c] = p
+
+    # -----------------------------------------------------
+    # 2-OPT
+    # -----------------------------------------------------
+
+    def _try_2opt(self, route, pos, a):
+        """Apply the first improving 2-opt move around city a, if any."""
+        N = self.N
+        d = self._d
+        i = pos[a]
+
+        for forward in (True, False):
+            b = route[(i + 1) % N] if forward else route[i - 1]
+            d_ab = d(a, b)
+
+            for c in self.neighbors[a]:
+                d_ac = d(a, c)
+                if d_ac >= d_ab:
+                    break  # candidates are sorted by distance
+                j = pos[c]
+                e = route[(j + 1) % N] if forward else route[j - 1]
+                if c == b or e == a:
+                    continue
+
+                delta = d_ac + d(b, e) - d_ab - d(c, e)
+                if delta < -1e-10:
+                    if forward:
+                        self._reverse(route, pos, (i + 1) % N, j)
+                    else:
+                        self._reverse(route, pos, i, (j - 1) % N)
+                    return delta, (a, b, c, e)
+
+        return 0.0, None
+
+    # -----------------------------------------------------
+    # OR-OPT
+    # -----------------------------------------------------
+
+    def _try_oropt(self, route, pos, a):
+        """Relocate a segment of 1..max_segment cities starting at a, if it improves."""
+        N = self.N
+        d = self._d
+        i = pos[a]
+
+        for L in range(1, min(self.max_segment, N - 3) + 1):
+            s1, s2 = a, route[(i + L - 1) % N]
+            p, n = route[i - 1], route[(i + L) % N]
+            inside = {route[(i + t) % N] for t in range(L)}
+
+            gain = d(p, s1) + d(s2, n) - d(p, n)
+            if gain <= 1e-10:
+                continue
+
+            # place s1 or s2 next to one of its neighbours c; as in 2-opt,
+            # only neighbours closer than the removal gain are worth trying
+            for s in (s1, s2):
+                for c in self.neighbors[s]:
+                    if d(s, c) >= gain:
+                        break
+                    if c in inside:
+                        continue
+                    jc = pos[c]
+                    succ, pred = route[(jc + 1) % N], route[jc - 1]
+                    # (u, v, reverse) so that s ends up adjacent to c
+                    if s == s1:
+                        options = ((c, succ, False), (pred, c, True))
+                    else:
+                        options = ((c, succ, True), (pred, c, False))
+
+                    for u, v, reverse in options:
+                        if u in inside or v in inside or (u == p and v == n):
+                            continue
+                        x, y = (s2, s1) if reverse else (s1, s2)
+                        delta = d(u, x) + d(y, v) - d(u, v) - gain
+                        if delta < -1e-10:
+                            self._move_segment(route, pos, s1, s2, u, reverse)
+                            return delta, (p, n, s1, s2, u, v)
+
+        return 0.0, None
+
+    # -----------------------------------------------------
+    # MAIN LOOP
+    # -----------------------------------------------------
+
+    def improve(self, route, start=None):
+        """
+        Run 2-opt and Or-opt until no improving move is left.
+        `start` restricts the cities examined first (all cities by default);
+        cities touched by an applied move are always re-examined.
+
+        Returns
+        -------
+        route : np.ndarray
+            Improved route (same dtype as the input).
+        delta : float
+            Change in route length (<= 0).
+        """
+        dtype = np.asarray(route).dtype
+        route = [int(c) for c in route]
+        pos = [0] * self.N
+        for p, c in enumerate(route):
+            pos[c] = p
+
+        total = 0.0
+        # don't-look bits: only cities in the queue are examined
+        queue = deque(route if start is None else (int(c) for c in start))
+        active = [False] * self.N
+        for c in queue:
+            active[c] = True
+
+        while queue:
+            a = queue.popleft()
+            active[a] = False
+
+            delta, touched = self._try_2opt(route, pos, a)
+            if touched is None:
+                delta, touched = self._try_oropt(route, pos, a)
+            if touched is None:
+                continue
+
+            total += delta
+            self.moves += 1
+            for c in touched:
+                if not active[c]:
+                    active[c] = True
+                    queue.append(c)
+
+        return np.array(route, dtype=dtype), total
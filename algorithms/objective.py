@@ -0,0 +1,28 @@
+import numpy as np
+
+
+# ============================================================
+# OBJECTIVE CALLS SHARED BY THE CONTINUOUS OPTIMIZERS
+# ============================================================
+# Three calling conventions are supported, in this order of precedence:
+# - evaluator: utils.evaluation.AsyncEvaluator, one point per call,
+#   evaluated concurrently (f is then unused)
+# - vectorized=True: f(X) on an (n, dim) array of points
+# - otherwise: f(x1, x2, ...) with one coordinate (array) per argument
+
+def evaluate_block(f, X, vectorized=False, evaluator=None):
+    """Objective values of an (n, dim) block of points."""
+    if evaluator is not None:
+        return evaluator.evaluate(X)
+    if vectorized:
+        return f(X)
+    return f(*np.asarray(X).T)
+
+
+def evaluate_point(f, x, vectorized=False, evaluator=None):
+    """Objective value of a single point."""
+    if evaluator is not None:
+        return evaluator.evaluate([x])[0]
+    if vectorized:
+        return f(np.asarray(x)[None, :])[0]
+    return f(*x)
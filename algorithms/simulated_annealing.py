@@ -1,41 +1,145 @@
+import math
+
 import numpy as np
 
+
+# --------------------------------------------------------------
+# Cooling schedules: T_next = schedule(T, rate), where rate is the
+# recent acceptance rate of the chain, counting only moves that change f
+# (a scalar, or one value per chain in search_batch, in which case T is
+# an array as well)
+# --------------------------------------------------------------
+
+class GeometricCooling:
+    """T <- alpha T (the classic schedule)."""
+
+    def __init__(self, alpha=0.99):
+        self.alpha = alpha
+
+    def __call__(self, T, rate):
+        return T * self.alpha
+
+
+class LundyMeesCooling:
+    """
+    Lundy & Mees: T <- T / (1 + beta T). Cools fast while hot and very
+    slowly near zero, so the chain spends its budget at low temperatures
+    without ever reaching T = 0.
+    """
+
+    def __init__(self, beta=0.01):
+        self.beta = beta
+
+    def __call__(self, T, rate):
+        return T / (1 + self.beta * T)
+
+
+class AdaptiveCooling:
+    """
+    Keeps the acceptance rate near target_rate: cools by alpha while more
+    moves are accepted than wanted, heats by 1/alpha while fewer are.
+    """
+
+    def __init__(self, target_rate=0.1, alpha=0.99):
+        self.target_rate = target_rate
+        self.alpha = alpha
+
+    def __call__(self, T, rate):
+        return T * np.where(rate > self.target_rate, self.alpha, 1 / self.alpha)
+
+
 class SimulatedAnnealingDiscrete:
     """
     General Simulated Annealing for DISCRETE problems.
     Works with:
     - provided objective function f(x)
-    - provided neighbor function
+    - provided neighbor function neighbor_fn(x); bind the chain's rng if it
+      needs one, e.g. functools.partial(neighbor, rng=rng)
+    f / f_batch may be memoized (utils.memo.MemoCache, or a LookupTable such
+    as problem7.queens_table()) so revisited solutions are not re-scored.
+
+    Incremental (delta) mode, for problems too large to re-score:
+    - delta_fn(state, move): change of f caused by a move, without applying it
+    - apply_fn(state, move): apply the move in place and return its inverse
+    - neighbor_fn(state) then proposes a move instead of a new solution
+    (see problems.discrete.problem7.QueensState and its hooks).
+
+    Batched mode (search_batch), many independent chains as one array:
+    - f_batch(X): f of every row of an (chains, n) array
+    - neighbor_batch(X, rng): one neighbor of every row
+
+    target: stop as soon as f reaches this value (None = run all max_it).
+
+    Cooling and freezing:
+    - schedule: GeometricCooling(alpha) by default, or LundyMeesCooling /
+      AdaptiveCooling (any callable (T, rate) -> T works)
+    - freeze_window: a chain that accepts no f-changing move for this many
+      iterations without reaching the target is frozen; it is then reheated
+      to reheat_T (default T0), or restarted from restart_fn(rng) when given
+      (not in delta mode). None disables freeze detection.
+    evals counts the objective evaluations of the last search.
     """
 
-    def __init__(self, f, neighbor_fn, T0=10.0, alpha=0.99, max_it=5000):
+    def __init__(self, f, neighbor_fn, T0=10.0, alpha=0.99, max_it=5000, rng=None,
+                 delta_fn=None, apply_fn=None, target=None, f_batch=None,
+                 neighbor_batch=None, schedule=None, freeze_window=None,
+                 reheat_T=None, restart_fn=None):
         self.f = f
         self.neighbor_fn = neighbor_fn
         self.T0 = T0
         self.alpha = alpha
         self.max_it = max_it
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.delta_fn = delta_fn
+        self.apply_fn = apply_fn
+        self.target = target
+        self.f_batch = f_batch
+        self.neighbor_batch = neighbor_batch
+        self.schedule = schedule if schedule is not None else GeometricCooling(alpha)
+        self.freeze_window = freeze_window
+        self.reheat_T = T0 if reheat_T is None else reheat_T
+        self.restart_fn = restart_fn
+
+        self.evals = 0
+        self.reheats = 0  # reheats / restarts of the last search
+
+        if (delta_fn is None) != (apply_fn is None):
+            raise ValueError("delta_fn and apply_fn must be given together")
 
     # --------------------------------------------------------------
 
+    def _frozen(self, still, best_f):
+        """Freeze test: no f-changing move for freeze_window iterations."""
+        return (self.freeze_window is not None and still >= self.freeze_window
+                and (self.target is None or best_f < self.target))
+
     def search(self, x0):
         """Run SA starting from initial solution x0."""
+        if self.delta_fn is not None:
+            return self._search_delta(x0)
 
         x = np.array(x0, dtype=int)
         fx = self.f(x)
+        self.evals, self.reheats = 1, 0
 
         best_x = x.copy()
         best_f = fx
 
         T = self.T0
+        rate = 1.0   # rate of accepted f-changing moves, averaged over ~100 iterations
+        still = 0    # iterations since f last changed
 
         for _ in range(self.max_it):
 
             candidate = self.neighbor_fn(x)
             f_candidate = self.f(candidate)
+            self.evals += 1
 
             delta = f_candidate - fx  # MAXIMIZATION
 
-            if delta > 0 or np.random.rand() < np.exp(delta / T):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                accept = delta > 0 or self.rng.random() < np.exp(delta / T)
+            if accept:
                 x = candidate
                 fx = f_candidate
 
@@ -43,10 +147,147 @@ class SimulatedAnnealingDiscrete:
                     best_f = fx
                     best_x = x.copy()
 
-            T *= self.alpha
+            changed = accept and delta != 0
+            rate += 0.01 * (changed - rate)
+            still = 0 if changed else still + 1
+            T = float(self.schedule(T, rate))
 
             # Stop early if optimum reached
-            if best_f == 28:
+            if self.target is not None and best_f >= self.target:
                 break
 
+            # Frozen below the target: reheat, or start over elsewhere
+            if self._frozen(still, best_f):
+                self.reheats += 1
+                T, rate, still = self.reheat_T, 1.0, 0
+                if self.restart_fn is not None:
+                    x = np.array(self.restart_fn(self.rng), dtype=int)
+                    fx = self.f(x)
+                    self.evals += 1
+
         return best_x, best_f
+
+    def _search_delta(self, state):
+        """
+        SA on a mutable state with O(1) move evaluation.
+
+        The state is modified in place and returned at its best value. The
+        best solution is never copied: the inverses of the moves accepted
+        since the last improvement are logged and replayed backwards at the
+        end, so each iteration stays O(1) even for n = 10^5 boards.
+        Frozen chains are reheated (restart_fn is not used here).
+        """
+        fx = self.f(state)
+        self.evals, self.reheats = 1, 0
+        best_f = fx
+        undo = []  # inverses of the moves accepted since the best
+
+        T = self.T0
+        rate = 1.0
+        still = 0
+
+        for _ in range(self.max_it):
+
+            move = self.neighbor_fn(state)
+            delta = self.delta_fn(state, move)  # MAXIMIZATION
+            self.evals += 1
+
+            accept = delta >= 0 or (T > 0 and self.rng.random() < math.exp(delta / T))
+            if accept:
+                undo.append(self.apply_fn(state, move))
+                fx += delta
+
+                if fx > best_f:
+                    best_f = fx
+                    undo.clear()
+
+            changed = accept and delta != 0
+            rate += 0.01 * (changed - rate)
+            still = 0 if changed else still + 1
+            T = float(self.schedule(T, rate))
+
+            # Stop early if optimum reached
+            if self.target is not None and best_f >= self.target:
+                break
+
+            if self._frozen(still, best_f):
+                self.reheats += 1
+                T, rate, still = self.reheat_T, 1.0, 0
+
+        for move in reversed(undo):
+            self.apply_fn(state, move)
+
+        return state, best_f
+
+    def search_batch(self, X0):
+        """
+        Run one SA chain per row of X0, all advanced together.
+
+        Every iteration proposes one neighbor per active chain, scores them
+        with a single f_batch call and applies the Metropolis test as an
+        array operation. Each chain has its own temperature, acceptance
+        rate and freeze counter; a chain that reaches the target stops, the
+        others go on.
+
+        Returns (best_X, best_F) of shapes (chains, n) and (chains,).
+        """
+        if self.f_batch is None or self.neighbor_batch is None:
+            raise ValueError("search_batch needs f_batch and neighbor_batch")
+
+        X = np.array(X0, dtype=int)
+        F = np.asarray(self.f_batch(X))
+        self.evals, self.reheats = len(X), 0
+
+        best_X = X.copy()
+        best_F = F.copy()
+
+        m = len(X)
+        T = np.full(m, float(self.T0))
+        rate = np.ones(m)
+        still = np.zeros(m, dtype=int)
+
+        active = np.arange(m)
+        if self.target is not None:
+            active = active[best_F < self.target]
+
+        for _ in range(self.max_it):
+            if len(active) == 0:
+                break
+
+            candidate = self.neighbor_batch(X[active], self.rng)
+            f_candidate = np.asarray(self.f_batch(candidate))
+            self.evals += len(active)
+
+            delta = f_candidate - F[active]  # MAXIMIZATION
+            with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+                accept = (delta > 0) | (self.rng.random(len(active)) < np.exp(delta / T[active]))
+
+            moved = active[accept]
+            X[moved] = candidate[accept]
+            F[moved] = f_candidate[accept]
+
+            improved = F[moved] > best_F[moved]
+            best_X[moved[improved]] = X[moved[improved]]
+            best_F[moved[improved]] = F[moved[improved]]
+
+            changed = accept & (delta != 0)
+            rate[active] += 0.01 * (changed - rate[active])
+            still[active] = np.where(changed, 0, still[active] + 1)
+            T[active] = self.schedule(T[active], rate[active])
+
+            # Stop each chain early once its optimum is reached
+            if self.target is not None:
+                active = active[best_F[active] < self.target]
+
+            # Frozen chains below the target: reheat, or start over elsewhere
+            if self.freeze_window is not None:
+                frozen = active[still[active] >= self.freeze_window]
+                if len(frozen):
+                    self.reheats += len(frozen)
+                    T[frozen], rate[frozen], still[frozen] = self.reheat_T, 1.0, 0
+                    if self.restart_fn is not None:
+                        X[frozen] = [self.restart_fn(self.rng) for _ in frozen]
+                        F[frozen] = self.f_batch(X[frozen])
+                        self.evals += len(frozen)
+
+        return best_X, best_F
@@ -0,0 +1,218 @@
+import numpy as np
+
+
+# ============================================================
+# RBF SURROGATE MODEL
+# ============================================================
+
+class RBFSurrogate:
+    """
+    Cubic radial basis function interpolant with a linear tail,
+    s(x) = sum_i w_i ||x - x_i||^3 + c^T [1, x].
+
+    Inputs are scaled to the unit box given by (lo, hi) and outputs are
+    standardized, so one model works for all the continuous problems.
+    """
+
+    def __init__(self, lo, hi, reg=1e-8):
+        self.lo = np.asarray(lo, dtype=float)
+        self.scale = np.asarray(hi, dtype=float) - self.lo
+        self.reg = reg
+
+    def _unit(self, X):
+        return (np.atleast_2d(X) - self.lo) / self.scale
+
+    def fit(self, X, y):
+        """Interpolate the samples X (n, dim) with values y (n,)."""
+        U = self._unit(X)
+        y = np.asarray(y, dtype=float)
+        n, d = U.shape
+
+        self.y_mean = y.mean()
+        self.y_std = y.std() or 1.0
+
+        Phi = np.linalg.norm(U[:, None, :] - U[None, :, :], axis=2) ** 3
+        P = np.hstack([np.ones((n, 1)), U])
+
+        A = np.zeros((n + d + 1, n + d + 1))
+        A[:n, :n] = Phi + self.reg * np.eye(n)
+        A[:n, n:] = P
+        A[n:, :n] = P.T
+        b = np.concatenate([(y - self.y_mean) / self.y_std, np.zeros(d + 1)])
+
+        coef = np.linalg.lstsq(A, b, rcond=None)[0]
+        self.U = U
+        self.w, self.c = coef[:n], coef[n:]
+        return self
+
+    def predict(self, X):
+        """
+        Predicted values of X (m, dim), and the distance (in the unit box)
+        from each point to its nearest sample.
+        """
+        V = self._unit(X)
+        r = np.linalg.norm(V[:, None, :] - self.U[None, :, :], axis=2)
+        s = r**3 @ self.w + self.c[0] + V @ self.c[1:]
+        return self.y_mean + self.y_std * s, r.min(axis=1)
+
+
+# ============================================================
+# SURROGATE-ASSISTED WRAPPER
+# ============================================================
+
+class SurrogateAssisted:
+    """
+    Pre-screen the candidates of a continuous optimizer with an RBF model,
+    so that only the most promising ones are evaluated on the real f.
+
+    Works with any optimizer that proposes points through `_neighbor(x)`
+    (HillClimbing, LocalRandomSearch), `_neighbors(x, K)` (HillClimbing in
+    steepest-ascent mode: the best K of pool * K neighbours are kept) or
+    `_sample_uniform(n)` (GlobalRandomSearch, whose blocks are shortened
+    to n_init samples during the run). Each proposal is replaced by
+    the best of `pool` proposals under the lower-confidence-bound acquisition
+
+        a(x) = s(x) - kappa * std(y) * dist(x)
+
+    where dist(x) is the distance to the nearest evaluated point, which
+    keeps the search from only trusting the model near known samples.
+
+    Parameters
+    ----------
+    optimizer : HillClimbing, LocalRandomSearch or GlobalRandomSearch
+        A configured optimizer; its max_it is still the budget of true
+        objective calls. Optimizers with an evaluator are rejected: their
+        concurrent evaluation does not go through the screened proposals.
+    pool : int
+        Candidates screened per true evaluation.
+    kappa : float
+        Exploration weight of the acquisition function.
+    n_model : int
+        The model is fitted on at most this many evaluated points, the ones
+        nearest to the screened candidates (keeps every fit O(n_model^3)).
+    n_init : int or None
+        True evaluations before screening starts (default: 2 * (dim + 1)).
+
+    Usage
+    -----
+    lrs = LocalRandomSearch(f, domain, max_it=200)
+    best_x, best_f = SurrogateAssisted(lrs).search()
+    """
+
+    def __init__(self, optimizer, pool=50, kappa=0.5, n_model=100, n_init=None):
+        if not (hasattr(optimizer, "_neighbor") or hasattr(optimizer, "_sample_uniform")):
+            raise TypeError(f"{type(optimizer).__name__} has no candidate proposal to screen")
+        if getattr(optimizer, "evaluator", None) is not None:
+            raise TypeError("SurrogateAssisted cannot screen an optimizer using an evaluator")
+
+        self.opt = optimizer
+        self.pool = pool
+        self.kappa = kappa
+        self.n_model = n_model
+        self.n_init = 2 * (optimizer.dim + 1) if n_init is None else n_init
+        self.model = RBFSurrogate(optimizer.lo, optimizer.hi)
+
+        self.X = []        # every point evaluated on the true objective
+        self.y = []
+        self.evals = 0     # true objective calls of the last search
+        self.screened = 0  # candidates rejected by the model
+
+    # -----------------------------------------------------
+    # Recording of true evaluations
+    # -----------------------------------------------------
+    def _record_one(self, x):
+        value = self._true_one(x)
+        self.X.append(np.array(x, dtype=float))
+        self.y.append(float(value))
+        self.evals += 1
+        return value
+
+    def _record(self, X):
+        values = np.asarray(self._true(X), dtype=float)
+        self.X.extend(np.array(X, dtype=float))
+        self.y.extend(values.tolist())
+        self.evals += len(values)
+        return values
+
+    # -----------------------------------------------------
+    # Screening
+    # -----------------------------------------------------
+    def _acquisition(self, C):
+        """Acquisition values of the candidates C (m, dim); lower is better."""
+        X = np.array(self.X)
+        y = np.array(self.y)
+
+        if len(X) > self.n_model:
+            # local model around the candidates
+            d = np.linalg.norm(X - C.mean(axis=0), axis=1)
+            keep = np.argpartition(d, self.n_model)[:self.n_model]
+            X, y = X[keep], y[keep]
+
+        pred, dist = self.model.fit(X, y).predict(C)
+        return pred - self.kappa * self.model.y_std * dist
+
+    def _screen(self, C, n):
+        """The n most promising rows of the candidate set C."""
+        if len(self.X) < self.n_init:
+            return C[:n]
+        a = self._acquisition(C)
+        self.screened += len(C) - n
+        return C[np.argsort(a)[:n]]
+
+    def _screened_neighbor(self, x):
+        C = np.array([self._propose(x) for _ in range(self.pool)])
+        return self._screen(C, 1)[0]
+
+    def _screened_neighbors(self, x, K):
+        return self._screen(self._propose(x, K * self.pool), K)
+
+    def _screened_sample(self, n=None):
+        if n is None:
+            return self._screened_sample(1)[0]
+        return self._screen(self._propose(n * self.pool), n)
+
+    # -----------------------------------------------------
+    # Main loop
+    # -----------------------------------------------------
+    def search(self):
+        """
+        Runs the wrapped optimizer's search() with screened proposals.
+
+        Returns
+        -------
+        best_x : np.ndarray
+            Best solution found.
+        best_f : float
+            Objective function value for best_x.
+        """
+        opt = self.opt
+        self.X, self.y = [], []
+        self.evals = self.screened = 0
+
+        self._true, self._true_one = opt._evaluate, opt._evaluate_one
+        if getattr(opt, "n_neighbors", 1) > 1:
+            hook, self._propose = "_neighbors", opt._neighbors
+            screened = self._screened_neighbors
+        elif hasattr(opt, "_neighbor"):
+            hook, self._propose = "_neighbor", opt._neighbor
+            screened = self._screened_neighbor
+        else:
+            hook, self._propose = "_sample_uniform", opt._sample_uniform
+            screened = self._screened_sample
+
+        # GRS draws whole blocks at once: keep them at most n_init long, or
+        # the budget is spent before the model has enough points to start
+        block = getattr(opt, "block", None)
+        if block is not None:
+            opt.block = min(block, self.n_init)
+
+        # instance attributes shadow the methods for the duration of the run
+        opt._evaluate, opt._evaluate_one = self._record, self._record_one
+        setattr(opt, hook, screened)
+        try:
+            return opt.search()
+        finally:
+            del opt._evaluate, opt._evaluate_one
+            delattr(opt, hook)
+            if block is not None:
+                opt.block = block
@@ -0,0 +1,171 @@
+import numpy as np
+
+
+# -----------------------------------------------------
+# NEAREST NEIGHBOUR
+# -----------------------------------------------------
+
+def nearest_neighbor_tour(D, start=0):
+    """Always move to the closest unvisited city, starting from `start`."""
+    N = len(D)
+    visited = np.zeros(N, dtype=bool)
+    tour = np.empty(N, dtype=int)
+
+    city = start
+    for t in range(N):
+        tour[t] = city
+        visited[city] = True
+        if t < N - 1:
+            d = np.where(visited, np.inf, D[city])
+            city = int(np.argmin(d))
+    return tour
+
+
+# -----------------------------------------------------
+# GREEDY EDGE
+# -----------------------------------------------------
+
+def greedy_edge_tour(D):
+    """
+    Add edges from shortest to longest whenever they keep every city at
+    degree <= 2 and close no premature cycle; the resulting fragments are
+    joined into one tour.
+    """
+    N = len(D)
+    if N < 3:
+        return np.arange(N)
+
+    iu, ju = np.triu_indices(N, k=1)
+    order = np.argsort(D[iu, ju], kind="stable")
+
+    parent = list(range(N))
+
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    degree = [0] * N
+    adj = [[] for _ in range(N)]
+    edges = 0
+    for e in order:
+        a, b = int(iu[e]), int(ju[e])
+        if degree[a] == 2 or degree[b] == 2:
+            continue
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            continue
+        parent[ra] = rb
+        degree[a] += 1
+        degree[b] += 1
+        adj[a].append(b)
+        adj[b].append(a)
+        edges += 1
+        if edges == N - 1:
+            break  # a single Hamiltonian path; closing it gives the tour
+
+    # walk the path from one of its two endpoints
+    start = next(c for c in range(N) if degree[c] < 2)
+    tour = [start]
+    prev, city = -1, start
+    while len(tour) < N:
+        nxt = next(c for c in adj[city] if c != prev)
+        tour.append(nxt)
+        prev, city = city, nxt
+    return np.array(tour)
+
+
+# -----------------------------------------------------
+# SPACE-FILLING CURVE
+# -----------------------------------------------------
+
+def _hilbert_index(coords, bits):
+    """
+    Position along a 3D Hilbert curve of integer coordinates in [0, 2**bits),
+    using Skilling's transpose algorithm vectorized over all points.
+    """
+    X = [coords[:, i].astype(np.int64) for i in range(coords.shape[1])]
+    n = len(X)
+    M = 1 << (bits - 1)
+
+    # inverse undo
+    Q = M
+    while Q > 1:
+        P = Q - 1
+        for i in range(n):
+            hit = (X[i] & Q) != 0
+            t = np.where(hit, 0, (X[0] ^ X[i]) & P)
+            X[0] = np.where(hit, X[0] ^ P, X[0] ^ t)
+            if i > 0:
+                X[i] = X[i] ^ t
+        Q >>= 1
+
+    # gray encode
+    for i in range(1, n):
+        X[i] = X[i] ^ X[i - 1]
+    t = np.zeros_like(X[0])
+    Q = M
+    while Q > 1:
+        t = np.where((X[n - 1] & Q) != 0, t ^ (Q - 1), t)
+        Q >>= 1
+    X = [x ^ t for x in X]
+
+    # interleave the transposed bits into one index
+    h = np.zeros_like(X[0])
+    for b in range(bits - 1, -1, -1):
+        for i in range(n):
+            h = (h << 1) | ((X[i] >> b) & 1)
+    return h
+
+
+def space_filling_curve_tour(points, bits=10):
+    """Visit the cities in the order they appear along a Hilbert curve."""
+    pts = np.asarray(points, dtype=float)
+    lo = pts.min(axis=0)
+    span = np.maximum(pts.max(axis=0) - lo, 1e-12).max()
+    coords = np.floor((pts - lo) / span * ((1 << bits) - 1)).astype(np.int64)
+    return np.argsort(_hilbert_index(coords, bits), kind="stable")
+
+
+# -----------------------------------------------------
+# POPULATION SEEDING
+# -----------------------------------------------------
+
+def double_bridge(tour, rng):
+    """Random double-bridge move (A B C D -> A C B D), keeps most edges."""
+    N = len(tour)
+    if N < 8:
+        return rng.permutation(tour)
+    a, b, c = np.sort(rng.choice(np.arange(1, N), 3, replace=False))
+    return np.concatenate([tour[:a], tour[b:c], tour[a:b], tour[c:]])
+
+
+def seed_tours(strategy, n, D, points, rng):
+    """
+    n tours built with a constructive heuristic:
+    - "nn": nearest neighbour from n different random start cities
+    - "greedy": greedy edge tour
+    - "sfc": Hilbert space-filling-curve order
+    Deterministic strategies yield one tour; extra copies are perturbed
+    by a double-bridge move so the population stays diverse.
+    "nn" and "greedy" need the distance matrix D; "sfc" only the points.
+    """
+    N = len(points)
+    if n <= 0:
+        return np.empty((0, N), dtype=int)
+    if D is None and strategy in ("nn", "greedy"):
+        raise ValueError(f"seeding strategy {strategy!r} needs a distance matrix")
+
+    if strategy == "nn":
+        starts = rng.choice(N, n, replace=n > N)
+        return np.array([nearest_neighbor_tour(D, s) for s in starts])
+
+    if strategy == "greedy":
+        base = greedy_edge_tour(D)
+    elif strategy == "sfc":
+        base = space_filling_curve_tour(points)
+    else:
+        raise ValueError(f"unknown seeding strategy: {strategy!r}")
+
+    return np.array([base] + [double_bridge(base, rng) for _ in range(n - 1)])
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import numpy as np
+
+from algorithms.global_random_search import GlobalRandomSearch
+from algorithms.hill_climbing import HillClimbing
+from algorithms.genetic_algorithm import GeneticTSP
+from problems.continuous.registry import get_problem
+from problems.discrete.problem8_tsp import load_points, distance_matrix, route_length
+from utils.evaluation import AsyncEvaluator
+from utils.memo import MemoCache
+
+
+# ---------------------------------------------------------
+# Sleep-based stand-ins for an external solver process
+# ---------------------------------------------------------
+
+class _SlowPoint:
+    """Blocking black box: f of one point after `delay` seconds."""
+
+    def __init__(self, f, delay):
+        self.f = f
+        self.delay = delay
+
+    def __call__(self, x):
+        time.sleep(self.delay)
+        return float(self.f(np.asarray(x)[None, :])[0])
+
+
+class _SlowPointAsync(_SlowPoint):
+    """Same black box as a coroutine (awaits instead of blocking)."""
+
+    async def __call__(self, x):
+        await asyncio.sleep(self.delay)
+        return float(self.f(np.asarray(x)[None, :])[0])
+
+
+class _SlowBatch(_SlowPoint):
+    """Synchronous baseline: one point after another."""
+
+    def __call__(self, X):
+        time.sleep(self.delay * len(X))
+        return self.f(X)
+
+
+class _SlowRoute:
+    """Blocking black box scoring one TSP route."""
+
+    def __init__(self, points, D, delay):
+        self.points = points
+        self.D = D
+        self.delay = delay
+
+    def __call__(self, route):
+        time.sleep(self.delay)
+        return route_length(route, self.points, self.D)
+
+
+def _timed(label, fn):
+    start = time.perf_counter()
+    best = fn()
+    print(f"{label:<34}: best = {best:.6g}, {time.perf_counter() - start:.2f} s")
+
+
+# ---------------------------------------------------------
+
+def run_async_benchmark(delay=0.01, max_in_flight=16, seed=0):
+    """
+    Wall time of synchronous vs. concurrent evaluation with a sleep-based
+    stand-in objective, for GRS, steepest-ascent HC and the TSP GA.
+    """
+    print("\n===== Concurrent Evaluation of a Slow Black-Box Objective =====\n")
+    print(f"{delay * 1e3:.0f} ms per evaluation, up to {max_in_flight} in flight\n")
+
+    bench = get_problem("problem3")
+    f, domain = bench.objective(), bench.domain(2)
+
+    # ------------------- GLOBAL RANDOM SEARCH -------------------
+    grs = dict(max_it=200, block=16)
+    _timed("grs sync", lambda: GlobalRandomSearch(
+        _SlowBatch(f, delay), domain, rng=np.random.default_rng(seed),
+        vectorized=True, **grs).search()[1])
+
+    with AsyncEvaluator(_SlowPoint(f, delay), max_in_flight) as ev:
+        _timed("grs threads", lambda: GlobalRandomSearch(
+            None, domain, rng=np.random.default_rng(seed), evaluator=ev, **grs).search()[1])
+
+    with AsyncEvaluator(_SlowPointAsync(f, delay), max_in_flight) as ev:
+        _timed("grs asyncio", lambda: GlobalRandomSearch(
+            None, domain, rng=np.random.default_rng(seed), evaluator=ev, **grs).search()[1])
+
+    # ------------------- STEEPEST-ASCENT HILL CLIMBING -------------------
+    hc = dict(eps=0.5, n_neighbors=max_in_flight, max_evals=320)
+    _timed("hc steepest sync", lambda: HillClimbing(
+        _SlowBatch(f, delay), domain, rng=np.random.default_rng(seed),
+        vectorized=True, **hc).search()[1])
+
+    with AsyncEvaluator(_SlowPoint(f, delay), max_in_flight) as ev:
+        _timed("hc steepest threads", lambda: HillClimbing(
+            None, domain, rng=np.random.default_rng(seed), evaluator=ev, **hc).search()[1])
+
+    # ------------------- TSP GENETIC ALGORITHM -------------------
+    points = load_points(N=40, seed=seed)
+    D = distance_matrix(points)
+    ga = dict(pop_size=32, max_gen=10, elitism=2, D=D)
+
+    def ga_run(ev, memo=None):
+        ga_ = GeneticTSP(points, rng=np.random.default_rng(seed), evaluator=ev, memo=memo, **ga)
+        return route_length(ga_.run()[0], points, D)
+
+    for label, in_flight in (("ga sync", 1), ("ga threads", max_in_flight)):
+        with AsyncEvaluator(_SlowRoute(points, D, delay), in_flight) as ev:
+            _timed(label, lambda: ga_run(ev))
+
+    # duplicate routes answered from the cache instead of the black box
+    memo = MemoCache()
+    with AsyncEvaluator(_SlowRoute(points, D, delay), max_in_flight) as ev:
+        _timed("ga threads + memo", lambda: ga_run(ev, memo))
+    print(f"memo hit rate: {memo.hit_rate:.1%}")
@@ -3,6 +3,8 @@ import os
 from algorithms.hill_climbing import HillClimbing
 from algorithms.local_random_search import LocalRandomSearch
 from algorithms.global_random_search import GlobalRandomSearch
+from algorithms.differential_evolution import DifferentialEvolution
+from algorithms.cma_es import CMAES
 
 from utils.plotting import plot_3d_surface
 from utils.helpers import save_table
@@ -16,6 +18,38 @@ from problems.continuous.problem5 import f as f5, domain as d5
 from problems.continuous.problem6 import f as f6, domain as d6
 
 from utils.helpers import compute_mode, save_mode
+from utils.parallel import run_parallel
+from problems.continuous.registry import REGISTRY
+
+
+class _Negated:
+    """Picklable -f(x1, x2, ...) wrapper: turns maximization into minimization."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def __call__(self, *x):
+        return -self.f(*x)
+
+
+def _search_run(rng, algorithm, f, domain, params):
+    """One independent run (module level so workers can unpickle it)."""
+    return algorithm(f, domain, rng=rng, **params).search()
+
+
+def _solve(algorithm, f, domain, params, n_runs, seed, batched, workers):
+    """
+    n_runs independent runs of one algorithm, as a list of (x_best, f_best).
+    batched=True advances all runs together with search_batch (one process);
+    otherwise runs are spread over a process pool.
+    """
+    if batched:
+        opt = algorithm(f, domain, rng=np.random.default_rng(seed), **params)
+        best_x, best_f = opt.search_batch(n_runs)
+        return list(zip(best_x, best_f))
+
+    return run_parallel(_search_run, n_runs, seed=seed, workers=workers,
+                        args=(algorithm, f, domain, params))
 
 
 def run_all_continuous():
@@ -36,6 +70,11 @@ def run_all_continuous():
     eps = 0.1    # HC
     sigma = 0.4  # LRS + GRS
 
+    SEED = None     # master seed (set an int for bit-identical sweeps)
+    BATCHED = True  # advance all runs as one array instead of a process pool
+    WORKERS = None  # worker processes when not batched (None = all cores)
+    seeds = iter(np.random.SeedSequence(SEED).spawn(3 * len(problems)))
+
     os.makedirs("results/tables", exist_ok=True)
     os.makedirs("results/plots",  exist_ok=True)
 
@@ -46,44 +85,36 @@ def run_all_continuous():
 
         # Wrap function for max problems
         if mode == "max":
-            f_wrapped = lambda x1, x2: -f(x1, x2)
+            f_wrapped = _Negated(f)
         else:
             f_wrapped = f
 
-        results_hc = []
-        results_lrs = []
-        results_grs = []
+        sign = -1 if mode == "max" else 1
 
         # ------------------- HILL CLIMBING -------------------
         print("Running Hill Climbing...")
-        for _ in range(N_RUNS):
-            hc = HillClimbing(f_wrapped, domain, eps=eps, max_it=MAX_IT, patience=PATIENCE)
-            x_best, f_best = hc.search()
-            if mode == "max":
-                f_best = -f_best
-            results_hc.append((x_best, f_best))
+        runs = _solve(HillClimbing, f_wrapped, domain,
+                      dict(eps=eps, max_it=MAX_IT, patience=PATIENCE),
+                      N_RUNS, next(seeds), BATCHED, WORKERS)
+        results_hc = [(x_best, sign * f_best) for x_best, f_best in runs]
         mode_x, mode_f, count = compute_mode(results_hc)
         save_mode(f"{name}_hc", mode_x, mode_f, count)
 
         # ------------------- LOCAL RANDOM SEARCH -------------------
         print("Running Local Random Search...")
-        for _ in range(N_RUNS):
-            lrs = LocalRandomSearch(f_wrapped, domain, sigma=sigma, max_it=MAX_IT)
-            x_best, f_best = lrs.search()
-            if mode == "max":
-                f_best = -f_best
-            results_lrs.append((x_best, f_best))
+        runs = _solve(LocalRandomSearch, f_wrapped, domain,
+                      dict(sigma=sigma, max_it=MAX_IT),
+                      N_RUNS, next(seeds), BATCHED, WORKERS)
+        results_lrs = [(x_best, sign * f_best) for x_best, f_best in runs]
         mode_x, mode_f, count = compute_mode(results_lrs)
         save_mode(f"{name}_lrs", mode_x, mode_f, count)
 
         # ------------------- GLOBAL RANDOM SEARCH -------------------
         print("Running Global Random Search...")
-        for _ in range(N_RUNS):
-            grs = GlobalRandomSearch(f_wrapped, domain, sigma=sigma, max_it=MAX_IT)
-            x_best, f_best = grs.search()
-            if mode == "max":
-                f_best = -f_best
-            results_grs.append((x_best, f_best))
+        runs = _solve(GlobalRandomSearch, f_wrapped, domain,
+                      dict(sigma=sigma, max_it=MAX_IT),
+                      N_RUNS, next(seeds), BATCHED, WORKERS)
+        results_grs = [(x_best, sign * f_best) for x_best, f_best in runs]
         mode_x, mode_f, count = compute_mode(results_grs)
         save_mode(f"{name}_grs", mode_x, mode_f, count)
         
@@ -103,3 +134,70 @@ def run_all_continuous():
 
 
         print(f"Completed {name}.\n")
+
+
+# ---------------------------------------------------------
+# OPTIONAL: dimension-generic benchmarks at high dimension
+# ---------------------------------------------------------
+
+def run_high_dim_continuous(dims=(100, 1000), n_runs=20, max_it=1000, seed=None):
+    """Batched HC / LRS / GRS on every registry problem defined for any d."""
+    print("\n===== Running High-Dimensional Continuous Experiments =====\n")
+
+    rng = np.random.default_rng(seed)
+    algorithms = [
+        ("hc", HillClimbing, dict(eps=0.1, max_it=max_it, patience=50)),
+        ("lrs", LocalRandomSearch, dict(sigma=0.4, max_it=max_it)),
+        ("grs", GlobalRandomSearch, dict(max_it=max_it)),
+    ]
+
+    for name, bench in REGISTRY.items():
+        if bench.dims is not None:
+            continue  # only defined in 2D
+
+        sign = -1 if bench.mode == "max" else 1
+        for d in dims:
+            for label, algorithm, params in algorithms:
+                opt = algorithm(bench.objective(), bench.domain(d), rng=rng,
+                                vectorized=True, **params)
+                _, best_f = opt.search_batch(n_runs)
+                best = sign * best_f.min()
+                print(f"{name} d={d:<5} {label}: best f = {best:.6g}")
+
+
+# ---------------------------------------------------------
+# OPTIONAL: population-based engines vs. 100 restarts
+# ---------------------------------------------------------
+
+# known global minima (minimization form) of the problems that have one
+KNOWN_OPTIMA = {"problem1": 0.0, "problem3": 0.0, "problem4": 0.0}
+
+
+def run_population_continuous(n_restarts=100, max_it=1000, tol=1e-6, seed=None):
+    """
+    Best value and total objective evaluations of one DE run and one CMA-ES
+    run against n_restarts batched HC runs, on the 2D version of every
+    problem. DE / CMA-ES stop as soon as they reach a known optimum (+ tol).
+    """
+    print("\n===== Population-Based Engines vs. Restarts =====\n")
+
+    seeds = iter(np.random.SeedSequence(seed).spawn(3 * len(REGISTRY)))
+
+    for name, bench in REGISTRY.items():
+        f, domain = bench.objective(), bench.domain(2)
+        sign = -1 if bench.mode == "max" else 1
+        target = KNOWN_OPTIMA.get(name)
+        if target is not None:
+            target += tol
+
+        hc = HillClimbing(f, domain, eps=0.1, max_it=max_it, patience=50,
+                          rng=np.random.default_rng(next(seeds)), vectorized=True)
+        _, best_f = hc.search_batch(n_restarts)
+        print(f"{name} hc x{n_restarts}: best f = {sign * best_f.min():.6g} "
+              f"({hc.evals} evals)")
+
+        for label, algorithm in (("de", DifferentialEvolution), ("cma", CMAES)):
+            opt = algorithm(f, domain, max_it=max_it, target=target,
+                            rng=np.random.default_rng(next(seeds)), vectorized=True)
+            _, best = opt.search()
+            print(f"{name} {label}: best f = {sign * best:.6g} ({opt.evals} evals)")
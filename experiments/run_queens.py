@@ -1,27 +1,38 @@
 import time
-from problems.discrete.problem7 import f, random_solution, neighbor
-from algorithms.simulated_annealing import SimulatedAnnealingDiscrete
+from functools import partial
+
+import numpy as np
+from problems.discrete.problem7 import (f, f_batch, random_solution, neighbor, neighbor_batch,
+                                        max_pairs, queen_attacks, QueensState, greedy_permutation,
+                                        state_value, conflict_swap, swap_delta, apply_swap,
+                                        enumerate_solutions, expand, canonical, symmetries,
+                                        queens_table)
+from algorithms.simulated_annealing import (SimulatedAnnealingDiscrete, GeometricCooling,
+                                            LundyMeesCooling, AdaptiveCooling)
 
 # ---------------------------------------------------------
 
 def run_queens_sa():
     print("\n===== Running 8-Queens with Simulated Annealing =====")
 
+    rng = np.random.default_rng()
     sa = SimulatedAnnealingDiscrete(
         f=f,
-        neighbor_fn=neighbor,
+        neighbor_fn=partial(neighbor, rng=rng),
         T0=10.0,
         alpha=0.99,
-        max_it=5000
+        max_it=5000,
+        rng=rng,
+        target=max_pairs(8)
     )
 
-    x0 = random_solution()
+    x0 = random_solution(rng)
     best_x, best_f = sa.search(x0)
 
     print("Best solution found:", best_x)
     print("Fitness:", best_f)
 
-    if best_f == 28:
+    if best_f == max_pairs(8):
         print("SUCCESS: Valid 8-queen solution found!")
     else:
         print("Did NOT reach the optimal solution.")
@@ -33,37 +44,171 @@ def run_queens_sa():
 # OPTIONAL: search for all 92 solutions
 # ---------------------------------------------------------
 
-def run_queens_find_all():
+class _TabuObjective:
+    """
+    Batched 8-queens objective that marks already-known solutions as tabu:
+    they score one below the optimum, so a chain that falls into a known
+    basin does not stop there but keeps searching for a new solution.
+    """
+
+    def __init__(self, f_batch, target):
+        self.f_batch = f_batch
+        self.target = target
+        self.known = set()
+
+    def __call__(self, X):
+        F = self.f_batch(X)
+        for i in np.flatnonzero(F == self.target):
+            if tuple(X[i]) in self.known:
+                F[i] -= 1
+        return F
+
+
+def run_queens_find_all(chains=500, use_table=False):
     print("\n===== Searching for ALL 92 8-Queen Solutions =====")
 
+    # ground truth: number of solutions and of symmetry classes
+    n_solutions, n_classes, _ = enumerate_solutions(8, workers=1, collect=False)
+
+    # use_table: every board's f read from a precomputed table instead of
+    # recounted (the first call builds it: ~15 s and 16 MB in .queens_cache/)
+    table = queens_table() if use_table else None
+    f_one, f_many = (table, table.batch) if use_table else (f, f_batch)
+
+    tabu = _TabuObjective(f_many, max_pairs(8))
     sa = SimulatedAnnealingDiscrete(
-        f=f,
+        f=f_one,
         neighbor_fn=neighbor,
         T0=10.0,
-        alpha=0.99,
-        max_it=5000
+        max_it=5000,
+        target=max_pairs(8),
+        schedule=AdaptiveCooling(target_rate=0.1, alpha=0.99),
+        f_batch=tabu,
+        neighbor_batch=neighbor_batch
     )
 
-    found = set()
+    classes = set()   # canonical representatives seen so far
+    found = tabu.known
     start = time.time()
     attempts = 0
+    sweeps = 0
 
-    while len(found) < 92:
-        attempts += 1
-        x0 = random_solution()
-        sol, val = sa.search(x0)
+    # each sweep runs `chains` independent restarts as one batched SA;
+    # a new solution reveals its whole class (up to 8 boards at once)
+    while len(classes) < n_classes:
+        sweeps += 1
+        attempts += chains
+        X0 = np.array([random_solution() for _ in range(chains)])
+        sols, vals = sa.search_batch(X0)
 
-        if val == 28:
-            found.add(tuple(sol))
+        for sol in sols[vals == sa.target]:
+            rep = tuple(canonical(sol))
+            if rep not in classes:
+                classes.add(rep)
+                found.update(map(tuple, symmetries(sol)))
 
-        if attempts % 50 == 0:
-            print(f"{len(found)}/92 solutions found...")
+        print(f"{len(classes)}/{n_classes} classes, {len(found)}/{n_solutions} "
+              f"solutions after {sweeps} sweeps...")
 
     end = time.time()
 
     print("\n===== Completed =====")
     print("Total unique solutions found:", len(found))
-    print("Total attempts:", attempts)
+    print("Total attempts:", attempts, f"({sweeps} batched sweeps)")
     print("Time:", end - start, "seconds")
+    if use_table:
+        print("Table lookups:", table.stats()["hits"])
+
+    return set(found)
+
+
+# ---------------------------------------------------------
+# OPTIONAL: cooling schedules vs. the classic defaults
+# ---------------------------------------------------------
+
+def _restart(rng):
+    return random_solution(rng)
+
+
+def run_queens_cooling(chains=2000, max_it=5000, seed=0, use_table=False):
+    print("\n===== 8-Queens: Evaluations per Solved Chain by Cooling Schedule =====")
+
+    table = queens_table() if use_table else None
+    f_one, f_many = (table, table.batch) if use_table else (f, f_batch)
+    configs = [
+        ("geometric 0.99 (default)", dict(schedule=GeometricCooling(0.99))),
+        ("geometric + reheat", dict(schedule=GeometricCooling(0.99), freeze_window=200)),
+        ("geometric + restart", dict(schedule=GeometricCooling(0.99), freeze_window=200,
+                                     restart_fn=_restart)),
+        ("Lundy-Mees + reheat", dict(schedule=LundyMeesCooling(0.05), freeze_window=200)),
+        ("adaptive (10% acceptance)", dict(schedule=AdaptiveCooling(0.1, 0.99))),
+    ]
+
+    for label, params in configs:
+        rng = np.random.default_rng(seed)
+        sa = SimulatedAnnealingDiscrete(
+            f=f_one, neighbor_fn=partial(neighbor, rng=rng), T0=10.0, max_it=max_it, rng=rng,
+            target=max_pairs(8), f_batch=f_many, neighbor_batch=neighbor_batch,
+            **params
+        )
+        X0 = rng.integers(1, 9, size=(chains, 8))
+        _, vals = sa.search_batch(X0)
+
+        solved = int(np.sum(vals == max_pairs(8)))
+        per_solved = sa.evals / solved if solved else float("inf")
+        print(f"{label:<26}: {solved / chains:6.1%} solved, "
+              f"{per_solved:8.0f} evals per solved chain, {sa.reheats} reheats")
+
+
+# ---------------------------------------------------------
+# OPTIONAL: exact enumeration (ground truth for the SA search)
+# ---------------------------------------------------------
+
+def run_queens_exact(sizes=range(4, 14), workers=None):
+    print("\n===== Exact N-Queens Enumeration (bitmask backtracking) =====")
+
+    for n in sizes:
+        start = time.time()
+        total, classes, _ = enumerate_solutions(n, workers=workers, collect=False)
+        print(f"n = {n:2d}: {total:>9} solutions, {classes:>7} up to symmetry "
+              f"({time.time() - start:.2f} s)")
+
+    # the 92 boards of the classic problem, expanded from the 12 classes
+    _, _, boards = enumerate_solutions(8, workers=1)
+    return {tuple(b) for b in expand(boards)}
+
+
+# ---------------------------------------------------------
+# OPTIONAL: very large boards with O(1) incremental moves
+# ---------------------------------------------------------
+
+def run_queens_large(n=100_000, max_it=5_000_000, seed=None):
+    print(f"\n===== Solving {n}-Queens with Incremental Simulated Annealing =====")
+
+    rng = np.random.default_rng(seed)
+
+    start = time.time()
+    state = QueensState(greedy_permutation(rng, n))
+    print(f"Greedy start: {state.attacks} attacking pairs ({time.time() - start:.2f} s)")
+
+    sa = SimulatedAnnealingDiscrete(
+        f=state_value,
+        neighbor_fn=partial(conflict_swap, rng=rng),
+        T0=0.5,
+        alpha=0.9999,
+        max_it=max_it,
+        rng=rng,
+        delta_fn=swap_delta,
+        apply_fn=apply_swap,
+        target=max_pairs(n)
+    )
+
+    start = time.time()
+    state, best_f = sa.search(state)
+    print(f"SA: {max_pairs(n) - best_f} attacking pairs left ({time.time() - start:.2f} s)")
+
+    # independent O(n) check of the returned board
+    x = state.x
+    print("Verified attacking pairs:", queen_attacks(x))
 
-    return found
+    return x, best_f
@@ -1,23 +1,45 @@
-import numpy as np
 import time
 import os
-from problems.discrete.problem8_tsp import load_points, route_length
+import numpy as np
+from problems.discrete.problem8_tsp import load_points, distance_matrix, route_length
 from algorithms.genetic_algorithm import GeneticTSP
-from utils.helpers import compute_mode, save_mode
+from algorithms.island_ga import IslandGeneticTSP
+from algorithms.cluster_tsp import ClusterFirstTSP
+from utils.helpers import integer_mode, save_mode
 from utils.plotting import plot_3d_route
+from utils.parallel import run_parallel
+from utils.shared import SharedArrays, attach_shared, shared_array
+
+
+def _ga_run(rng, ga_kwargs, acceptable_cost):
+    """
+    One independent GA run (module level so workers can unpickle it).
+    Points and distances are read from shared memory, not pickled per run.
+    """
+    ga = GeneticTSP(shared_array("points"), D=shared_array("D"), rng=rng, **ga_kwargs)
+    return ga.run(acceptable_cost=acceptable_cost)
+
 
 def run_tsp_ga():
     print("\n===== Running TSP with Genetic Algorithm =====")
 
+    SEED = None        # master seed (set an int for bit-identical results)
+    WORKERS = None     # worker processes (None = all cores)
+
+    # the city subset and the runs get independent streams of SEED
+    points_seed, runs_seed = np.random.SeedSequence(SEED).spawn(2)
+
     # 1) Choose number of points (N between 30 and 60)
     N_POINTS = 40
-    points = load_points(N=N_POINTS)
+    points = load_points(N=N_POINTS, rng=np.random.default_rng(points_seed))
+    D = distance_matrix(points)  # shared by every run
 
     POP_SIZE = 120
     MAX_GEN = 300
     RUNS = 100
 
     ACCEPTABLE = None  # optional stopping criterion
+    SEEDING = None     # e.g. {"nn": 0.2, "greedy": 0.05, "sfc": 0.05} (rest random)
 
     generations_needed = []
 
@@ -25,21 +47,25 @@ def run_tsp_ga():
     best_overall_cost = float("inf")
     best_run_index = None
 
-    for run_idx in range(RUNS):
+    ga_kwargs = dict(pop_size=POP_SIZE,
+                     max_gen=MAX_GEN,
+                     tournament_k=3,
+                     mutation_prob=0.01,
+                     elitism=2,
+                     seeding=SEEDING)
 
-        ga = GeneticTSP(points,
-                        pop_size=POP_SIZE,
-                        max_gen=MAX_GEN,
-                        tournament_k=3,
-                        mutation_prob=0.01,
-                        elitism=2)
+    with SharedArrays(points=points, D=D) as shared:
+        runs = run_parallel(_ga_run, RUNS, seed=runs_seed, workers=WORKERS,
+                            args=(ga_kwargs, ACCEPTABLE),
+                            initializer=attach_shared, initargs=(shared.handles,))
+
+    for run_idx, (best_ind, gen) in enumerate(runs):
 
-        best_ind, gen = ga.run(acceptable_cost=ACCEPTABLE)
         generations_needed.append(gen)
 
         # compute cost of this run's best_ind (guard if None)
         if best_ind is not None:
-            cost = route_length(best_ind, points)
+            cost = route_length(best_ind, points, D)
             # update global best
             if cost < best_overall_cost:
                 best_overall_cost = cost
@@ -47,11 +73,9 @@ def run_tsp_ga():
                 best_run_index = run_idx
 
     # SAVE mode of generations
-    gens_arr = np.array(generations_needed)
-    values = [(np.array([g]), 0) for g in gens_arr]  # hack for mode fn
-    mode_g, _, count = compute_mode(values)
+    mode_g, count, _ = integer_mode(generations_needed)
 
-    print("\nMode of generations:", int(mode_g[0]))
+    print("\nMode of generations:", mode_g)
     print("Frequency:", count)
 
     save_mode("tsp_ga_generations", mode_g, 0, count)
@@ -83,3 +107,65 @@ def run_tsp_ga():
         plot_3d_route(points, best_overall, title=f"TSP best route (cost={best_overall_cost:.4f})", filename="tsp_route.png")
     else:
         print("[warn] skipping plotting because no route available")
+
+
+# ---------------------------------------------------------
+# OPTIONAL: island-model GA (one process per island)
+# ---------------------------------------------------------
+
+def run_tsp_islands():
+    print("\n===== Running TSP with Island-Model Genetic Algorithm =====")
+
+    points = load_points(N=40)
+
+    islands = IslandGeneticTSP(points,
+                               n_islands=os.cpu_count() or 1,
+                               migration_interval=20,
+                               migration_count=2,
+                               pop_size=120,
+                               max_gen=300,
+                               tournament_k=3,
+                               mutation_prob=0.01,
+                               elitism=2)
+
+    start = time.time()
+    best_ind, best_cost, stats = islands.run()
+    end = time.time()
+
+    for s in stats:
+        print(f"island {s['island']}: best={s['best_cost']:.4f} "
+              f"generations={s['generations']} migrants={s['migrants_received']}")
+
+    print("Best route length:", best_cost)
+    print("Time:", end - start, "seconds")
+
+    return best_ind, best_cost, stats
+
+
+# ---------------------------------------------------------
+# OPTIONAL: cluster-first solver on the whole grouped dataset
+# ---------------------------------------------------------
+
+def run_tsp_clusters():
+    print("\n===== Running Cluster-First TSP on all groups =====")
+
+    points, groups = load_points(N=None, return_groups=True)
+    ga_kwargs = dict(pop_size=120, max_gen=300, tournament_k=3,
+                     mutation_prob=0.01, elitism=2)
+
+    solver = ClusterFirstTSP(points, groups, **ga_kwargs)
+    route, cost, stats = solver.run()
+    print("Group order:", stats["group_order"])
+    print(f"Cluster-first cost: {cost:.4f} ({stats['time']:.2f} s)")
+
+    # reference: one GeneticTSP run over every city
+    start = time.time()
+    ga = GeneticTSP(points, **ga_kwargs)
+    ga.run()
+    ga_time = time.time() - start
+    print(f"Full GeneticTSP cost: {ga.best_cost:.4f} ({ga_time:.2f} s)")
+
+    gap = 100.0 * (cost - ga.best_cost) / ga.best_cost
+    print(f"Cost gap vs full GA: {gap:+.2f}%")
+
+    return route, cost, gap
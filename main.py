@@ -1,9 +1,21 @@
-from experiments.run_continuous import run_all_continuous
-from experiments.run_queens import run_queens_find_all
-from experiments.run_tsp_ga import run_tsp_ga
+from experiments.run_continuous import run_all_continuous, run_high_dim_continuous, run_population_continuous
+from experiments.run_surrogate import run_surrogate_benchmark
+from experiments.run_async import run_async_benchmark
+from experiments.run_queens import (run_queens_find_all, run_queens_cooling, run_queens_exact,
+                                 run_queens_large)
+from experiments.run_tsp_ga import run_tsp_ga, run_tsp_islands, run_tsp_clusters
 
 
 if __name__ == "__main__":
     #run_all_continuous()     # Runs all 6 continuous problems with HC, LRS, GRS
+    #run_high_dim_continuous() # Runs the dimension-generic problems at d = 100 and 1000
+    #run_population_continuous() # Compares DE / CMA-ES evaluation counts with 100 HC restarts
+    #run_surrogate_benchmark()   # Plain vs. RBF-screened LRS on a slowed-down objective
+    #run_async_benchmark()       # Sync vs. concurrent evaluation of a sleep-based black box
     #run_queens_find_all()     # Runs simulated annealing for 8 queens
+    #run_queens_cooling()      # Evaluations per solved chain for each cooling schedule
+    #run_queens_exact()        # Exact solution counts by bitmask backtracking (n = 4..13)
+    #run_queens_large()        # Solves n = 10^5 queens with O(1) delta moves
     run_tsp_ga()             # Runs GA for TSP
+    #run_tsp_islands()        # Runs island-model GA for TSP (one process per island)
+    #run_tsp_clusters()       # Solves each CSV group separately, then stitches the tours
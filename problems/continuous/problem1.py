@@ -1,5 +1,13 @@
+import numpy as np
+
 def f(x1, x2):
     return x1**2 + x2**2
 
 domain = [(-100, 100), (-100, 100)]
 name = "problem1"
+
+# Dimension-generic form (sphere): X is an (n, d) array of points
+def f_batch(X):
+    return np.sum(X**2, axis=1)
+
+lower, upper = -100.0, 100.0  # same bounds on every coordinate
@@ -4,3 +4,10 @@ def f(x1, x2):
     return np.exp(-(x1**2 + x2**2)) + 2 * np.exp(-(x1 - 1.7)**2 + (x2 - 1.7)**2)
 
 domain = [(-2, 4), (-2, 5)]
+
+# Only defined in 2D: X is an (n, 2) array of points
+def f_batch(X):
+    return f(X[:, 0], X[:, 1])
+
+dims = 2
+lower, upper = np.array([-2.0, -2.0]), np.array([4.0, 5.0])
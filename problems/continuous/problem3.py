@@ -6,3 +6,11 @@ def f(x1, x2):
     return term1 + term2 + 20 + np.e
 
 domain = [(-8, 8), (-8, 8)]
+
+# Dimension-generic form (Ackley): X is an (n, d) array of points
+def f_batch(X):
+    term1 = -20 * np.exp(-0.2 * np.sqrt(np.mean(X**2, axis=1)))
+    term2 = -np.exp(np.mean(np.cos(2 * np.pi * X), axis=1))
+    return term1 + term2 + 20 + np.e
+
+lower, upper = -8.0, 8.0
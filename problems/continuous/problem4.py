@@ -7,3 +7,9 @@ def f(x1, x2):
     )
 
 domain = [(-5.12, 5.12), (-5.12, 5.12)]
+
+# Dimension-generic form (Rastrigin): X is an (n, d) array of points
+def f_batch(X):
+    return np.sum(X**2 - 10 * np.cos(2 * np.pi * X) + 10, axis=1)
+
+lower, upper = -5.12, 5.12
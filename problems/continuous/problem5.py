@@ -4,3 +4,10 @@ def f(x1, x2):
     return (x1 * np.cos(x1)) / 20 + 2 * np.exp(-(x1**2) - (x2 - 1)**2) + 0.01 * x1 * x2
 
 domain = [(-10, 10), (-10, 10)]
+
+# Only defined in 2D: X is an (n, 2) array of points
+def f_batch(X):
+    return f(X[:, 0], X[:, 1])
+
+dims = 2
+lower, upper = -10.0, 10.0
@@ -4,3 +4,10 @@ def f(x1, x2):
     return x1 * np.sin(4 * np.pi * x1) - x2 * np.sin(4 * np.pi * x2 + np.pi) + 1
 
 domain = [(-1, 3), (-1, 3)]
+
+# Dimension-generic form: -x sin(4*pi*x + pi) == x sin(4*pi*x), so every
+# coordinate contributes the same term. X is an (n, d) array of points
+def f_batch(X):
+    return np.sum(X * np.sin(4 * np.pi * X), axis=1) + 1
+
+lower, upper = -1.0, 3.0
@@ -0,0 +1,67 @@
+import numpy as np
+
+from problems.continuous import problem1, problem2, problem3, problem4, problem5, problem6
+
+
+class Benchmark:
+    """
+    A continuous benchmark usable at any supported dimension.
+
+    f takes an (n, d) array of points and returns n values, and the domain
+    is held as two bound vectors, so nothing loops over coordinates.
+    """
+
+    def __init__(self, name, module, mode):
+        self.name = name
+        self.f = module.f_batch
+        self.f2d = module.f          # original f(x1, x2), used for plots
+        self.mode = mode             # "min" or "max"
+        self.dims = getattr(module, "dims", None)  # None = any dimension
+        self._lower = module.lower
+        self._upper = module.upper
+
+    def bounds(self, d=2):
+        """(lower, upper) bound vectors of length d."""
+        if self.dims is not None and d != self.dims:
+            raise ValueError(f"{self.name} is only defined for d = {self.dims}")
+        lo = np.broadcast_to(np.asarray(self._lower, dtype=float), (d,)).copy()
+        hi = np.broadcast_to(np.asarray(self._upper, dtype=float), (d,)).copy()
+        return lo, hi
+
+    def domain(self, d=2):
+        """(d, 2) array of [min, max] rows, the format the optimizers take."""
+        return np.column_stack(self.bounds(d))
+
+    def objective(self):
+        """Batched objective in minimization form (negated for max problems)."""
+        if self.mode == "max":
+            return _NegatedBatch(self.f)
+        return self.f
+
+
+class _NegatedBatch:
+    """Picklable -f(X) wrapper."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def __call__(self, X):
+        return -self.f(X)
+
+
+REGISTRY = {
+    "problem1": Benchmark("problem1", problem1, "min"),   # sphere
+    "problem2": Benchmark("problem2", problem2, "max"),
+    "problem3": Benchmark("problem3", problem3, "min"),   # Ackley
+    "problem4": Benchmark("problem4", problem4, "min"),   # Rastrigin
+    "problem5": Benchmark("problem5", problem5, "max"),
+    "problem6": Benchmark("problem6", problem6, "max"),
+}
+
+
+def get_problem(name):
+    """Look up a benchmark by name (e.g. "problem3")."""
+    try:
+        return REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"unknown problem {name!r}; available: {sorted(REGISTRY)}") from None
@@ -1,25 +1,54 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
+from utils.memo import LookupTable
+
+DEFAULT_CACHE_DIR = ".queens_cache"
+
+# Boards are vectors x of n integers: x[c] is the row (1..n) of the queen in
+# column c. The classic problem is n = 8, but everything below works for
+# any n.
+
 # --------------------------
 # 1. Count attacking pairs
 # --------------------------
 
+def max_pairs(n):
+    """Number of queen pairs on an n-board: n(n-1)/2 (28 for n = 8)."""
+    return n * (n - 1) // 2
+
+
 def queen_attacks(x):
     """
     Count how many pairs of queens are attacking each other.
-    x is a vector of 8 integers (1–8).
+    x is a vector of n integers (1–n).
+
+    Every queen lies on one row, one diagonal and one anti-diagonal; the
+    three families are offset into disjoint index ranges and counted with a
+    single bincount, so this is O(n) instead of a double loop.
     """
+    x = np.asarray(x, dtype=np.int64)
+    n = len(x)
+    cols = np.arange(n)
+    lines = np.concatenate([x,                          # rows: 1..n
+                            x - cols + 2 * n,           # diagonals: n+2..3n
+                            x + cols + 3 * n])          # anti-diagonals: 3n+1..5n-1
+    counts = np.bincount(lines)
+    return int(np.sum(counts * (counts - 1) // 2))
 
-    h = 0
-    for i in range(8):
-        for j in range(i + 1, 8):
-            # same row
-            if x[i] == x[j]:
-                h += 1
-            # diagonal attack
-            if abs(x[i] - x[j]) == abs(i - j):
-                h += 1
-    return h
+
+def queen_attacks_batch(X):
+    """queen_attacks of every row of an (m, n) array of boards."""
+    X = np.asarray(X, dtype=np.int64)
+    m, n = X.shape
+    cols = np.arange(n)
+    lines = np.concatenate([X, X - cols + 2 * n, X + cols + 3 * n], axis=1)
+    # one bincount for all boards: board i owns bins [5n i, 5n (i + 1))
+    lines += 5 * n * np.arange(m)[:, None]
+    counts = np.bincount(lines.ravel(), minlength=5 * n * m).reshape(m, 5 * n)
+    return np.sum(counts * (counts - 1) // 2, axis=1)
 
 
 # --------------------------
@@ -29,35 +58,393 @@ def queen_attacks(x):
 def f(x):
     """
     Objective function:
-    f(x) = 28 - h(x)
+    f(x) = n(n-1)/2 - h(x)   (28 - h(x) for 8 queens)
     MAXIMIZATION.
     """
-    return 28 - queen_attacks(x)
+    return max_pairs(len(x)) - queen_attacks(x)
+
+
+def f_batch(X):
+    """f of every row of an (m, n) array of boards."""
+    return max_pairs(np.shape(X)[1]) - queen_attacks_batch(X)
+
+
+def queens_table(cache_dir=DEFAULT_CACHE_DIR):
+    """
+    f of all 8^8 (~16.7M) boards as a memory-mapped uint8 table, built on
+    first use (~15 s) and then read from disk. Use table(x) /
+    table.batch(X) in place of f / f_batch.
+    """
+    return LookupTable(f_batch, n=8, low=1, high=8,
+                       path=os.path.join(cache_dir, "queens8_f.npy"))
 
 
 # --------------------------
 # 3. Random initial solution
 # --------------------------
 
-def random_solution():
-    """Generate a random queen position (1–8 in each column)."""
-    return np.random.randint(1, 9, size=8)
+def random_solution(rng=None, n=8):
+    """Generate a random queen position (1–n in each column)."""
+    if rng is None:   # legacy global state (honours np.random.seed)
+        return np.random.randint(1, n + 1, size=n)
+    return rng.integers(1, n + 1, size=n)
+
+
+def greedy_permutation(rng=None, n=8, tries=None):
+    """
+    Permutation board built column by column: each queen gets a random
+    unused row whose diagonals are still free, trying at most `tries` rows
+    (default 3 log n) before accepting a conflict. Leaves only a few dozen
+    attacking pairs even for n = 10^5, so SA only has to repair the tail.
+    """
+    rng = rng if rng is not None else np.random   # legacy global state
+    tries = tries if tries is not None else max(1, int(3 * np.log(n + 1)))
+
+    rows = (rng.permutation(n) + 1).tolist()   # rows[c:] are still unused
+    diag = [False] * (2 * n + 1)
+    anti = [False] * (2 * n + 1)
+    u, p = [], 0  # uniform draws, consumed from a refilled buffer
+
+    for c in range(n):
+        free = n - c
+        for _ in range(tries):
+            if p == len(u):
+                u, p = rng.random(n + 1024).tolist(), 0
+            k = c + int(u[p] * free)
+            p += 1
+            r = rows[k]
+            if not diag[r - c + n] and not anti[r + c]:
+                break
+        rows[c], rows[k] = rows[k], rows[c]
+        diag[r - c + n] = anti[r + c] = True
+
+    return np.array(rows)
 
 
 # --------------------------
 # 4. Neighbor generation (Option A: MINIMAL MOVEMENT)
 # --------------------------
 
-def neighbor(x):
+def neighbor(x, rng=None):
     """
     Minimal movement neighbor:
     pick 1 column, move queen up or down by 1.
-    Clip between 1 and 8.
+    Clip between 1 and n.
     """
+    n = len(x)
     x_new = x.copy()
 
-    col = np.random.randint(0, 8)
-    step = np.random.choice([-1, 1])
+    if rng is None:   # legacy global state (honours np.random.seed)
+        col = np.random.randint(0, n)
+        step = np.random.choice([-1, 1])
+    else:
+        col = rng.integers(0, n)
+        step = rng.choice([-1, 1])
 
-    x_new[col] = np.clip(x_new[col] + step, 1, 8)
+    x_new[col] = np.clip(x_new[col] + step, 1, n)
     return x_new
+
+
+def neighbor_batch(X, rng=None):
+    """neighbor() applied to every row of an (m, n) array at once."""
+    m, n = X.shape
+    X_new = X.copy()
+
+    rows = np.arange(m)
+    if rng is None:   # legacy global state (honours np.random.seed)
+        col = np.random.randint(0, n, size=m)
+        step = np.random.choice([-1, 1], size=m)
+    else:
+        col = rng.integers(0, n, size=m)
+        step = rng.choice([-1, 1], size=m)
+
+    X_new[rows, col] = np.clip(X_new[rows, col] + step, 1, n)
+    return X_new
+
+
+# --------------------------
+# 5. Incremental state for large boards
+# --------------------------
+
+class QueensState:
+    """
+    An n-queens board with occupancy counters for every row, diagonal and
+    anti-diagonal, so the change in attacking pairs caused by moving one
+    queen is known in O(1) instead of re-scoring the board.
+
+    Used by SimulatedAnnealingDiscrete in delta mode through the swap hooks
+    below (state_value, conflict_swap, swap_delta, apply_swap).
+    The counters are plain lists: scalar indexing of lists is much faster
+    than of NumPy arrays in the SA inner loop.
+    """
+
+    def __init__(self, x):
+        x = np.asarray(x, dtype=np.int64)
+        n = len(x)
+        self.n = n
+        self.rows = x.tolist()
+
+        cols = np.arange(n)
+        rc = np.bincount(x, minlength=n + 1)
+        dc = np.bincount(x - cols + n, minlength=2 * n + 1)
+        ac = np.bincount(x + cols, minlength=2 * n + 1)
+        self.row_count, self.diag_count, self.anti_count = rc.tolist(), dc.tolist(), ac.tolist()
+
+        self.attacks = queen_attacks(x)
+
+        # columns whose queen may be attacked: every line holding k >= 2
+        # queens has at least k - 1 of them listed; stale entries are
+        # dropped lazily by attacked_column
+        attacked = (rc[x] > 1) | (dc[x - cols + n] > 1) | (ac[x + cols] > 1)
+        self.hot = np.flatnonzero(attacked).tolist()
+        self.is_hot = [False] * n
+        for c in self.hot:
+            self.is_hot[c] = True
+
+    @property
+    def x(self):
+        """The board as a vector of rows (a copy)."""
+        return np.array(self.rows)
+
+    @property
+    def value(self):
+        """f of the board: n(n-1)/2 - attacking pairs."""
+        return max_pairs(self.n) - self.attacks
+
+    def conflicts(self, col, row):
+        """Queens (other than column col's) on the lines through (col, row)."""
+        n, own = self.n, self.rows[col] == row
+        return (self.row_count[row] + self.diag_count[row - col + n]
+                + self.anti_count[row + col] - 3 * own)
+
+    def move(self, col, row):
+        """Move the queen of column col to row; returns the old row."""
+        n, old = self.n, self.rows[col]
+        if row == old:
+            return old
+
+        self.attacks -= self.conflicts(col, old)
+        self.row_count[old] -= 1
+        self.diag_count[old - col + n] -= 1
+        self.anti_count[old + col] -= 1
+
+        added = self.conflicts(col, row)
+        self.attacks += added
+        if added and not self.is_hot[col]:
+            self.hot.append(col)
+            self.is_hot[col] = True
+        self.row_count[row] += 1
+        self.diag_count[row - col + n] += 1
+        self.anti_count[row + col] += 1
+
+        self.rows[col] = row
+        return old
+
+    def attacked_column(self, rng):
+        """A random column whose queen is attacked (any column if none is)."""
+        hot = self.hot
+        while hot:
+            i = int(rng.random() * len(hot))
+            c = hot[i]
+            if self.conflicts(c, self.rows[c]) > 0:
+                return c
+            hot[i] = hot[-1]
+            hot.pop()
+            self.is_hot[c] = False
+        return int(rng.random() * self.n)
+
+    def swap_delta(self, c1, c2):
+        """
+        Change of f if the queens of columns c1 and c2 exchange rows.
+        Swaps keep a permutation board a permutation, so only diagonal
+        attacks ever change (the moves used for very large n).
+        """
+        r1, r2 = self.rows[c1], self.rows[c2]
+        if r1 == r2:
+            return 0
+        # the pair attacks itself before the swap iff it does after it
+        pair = abs(r1 - r2) == abs(c1 - c2)
+        before = self.conflicts(c1, r1) + self.conflicts(c2, r2)
+        after = self.conflicts(c1, r2) + self.conflicts(c2, r1) - 2 + 2 * pair
+        return before - after
+
+    def swap(self, c1, c2):
+        """Exchange the rows of the queens in columns c1 and c2."""
+        r1, r2 = self.rows[c1], self.rows[c2]
+        self.move(c1, r2)
+        self.move(c2, r1)
+
+
+# SA hooks for QueensState on permutation boards (moves are (c1, c2) row swaps)
+
+def state_value(state):
+    """f of a QueensState, read from its counters."""
+    return state.value
+
+
+def conflict_swap(state, rng):
+    """
+    Swap an attacked queen with a random other column. On large boards
+    almost every queen is safe, so this is what makes n = 10^5 tractable.
+    """
+    n = state.n
+    c1 = state.attacked_column(rng)
+    c2 = int(rng.random() * (n - 1))
+    return c1, c2 + (c2 >= c1)
+
+
+def swap_delta(state, move):
+    """Change of f caused by a (c1, c2) swap, in O(1)."""
+    return state.swap_delta(*move)
+
+
+def apply_swap(state, move):
+    """Apply a (c1, c2) swap; a swap is its own inverse."""
+    state.swap(*move)
+    return move
+
+
+# --------------------------
+# 6. Board symmetries
+# --------------------------
+
+def symmetries(x):
+    """
+    The 8 images of a board under rotations and reflections, as an
+    (8, n) array. Only valid for permutation boards (one queen per row),
+    which every solution is.
+    """
+    x = np.asarray(x)
+    n = len(x)
+    inv = np.empty(n, dtype=x.dtype)
+    inv[x - 1] = np.arange(1, n + 1)        # transpose: column of each row
+
+    images = [x, inv]
+    images += [im[::-1] for im in images]   # left-right mirror
+    images += [n + 1 - im for im in images] # up-down mirror
+    return np.array(images)
+
+
+def canonical(x):
+    """Lexicographically smallest image of a solution under the 8 symmetries."""
+    S = symmetries(x)
+    return S[np.lexsort(S.T[::-1])[0]]
+
+
+def expand(boards):
+    """All distinct images of the given (canonical) solutions, sorted."""
+    images = np.concatenate([symmetries(b) for b in boards]) if len(boards) else np.empty((0, 0), int)
+    return np.unique(images, axis=0)
+
+
+# --------------------------
+# 7. Exhaustive enumeration (bitmask backtracking)
+# --------------------------
+
+def _canonical_orbit(p, n):
+    """
+    Orbit size (2, 4 or 8) of the 0-based solution p if p is the smallest
+    of its 8 images, else 0. Works on plain lists for speed.
+    """
+    q = [0] * n
+    for c, r in enumerate(p):
+        q[r] = c
+    flip = [n - 1 - r for r in p]
+    flip_q = [n - 1 - c for c in q]
+
+    images = (flip, p[::-1], flip[::-1], q, flip_q, q[::-1], flip_q[::-1])
+    for im in images:
+        if im < p:
+            return 0
+    return len({tuple(p), *map(tuple, images)})
+
+
+def _subtree(n, prefix, collect):
+    """
+    Backtrack below a fixed placement of the first columns.
+
+    Queens are placed column by column; the free rows of the next column
+    are the zero bits of (rows | diagonals | anti-diagonals), three ints
+    shifted by one bit per column. Every leaf is a solution; only the
+    canonical ones are kept, each standing for its whole orbit.
+
+    Returns (solutions, classes, canonical boards or None).
+    """
+    full = (1 << n) - 1
+    p = [0] * n
+    total = classes = 0
+    boards = [] if collect else None
+
+    cols = d1 = d2 = 0
+    for c, r in enumerate(prefix):
+        bit = 1 << r
+        if (cols | d1 | d2) & bit:
+            return 0, 0, boards   # the prefix itself is attacked
+        p[c] = r
+        cols, d1, d2 = cols | bit, ((d1 | bit) << 1) & full, (d2 | bit) >> 1
+
+    def place(c, cols, d1, d2):
+        nonlocal total, classes
+        if c == n:
+            orbit = _canonical_orbit(p, n)
+            if orbit:
+                total += orbit
+                classes += 1
+                if collect:
+                    boards.append([r + 1 for r in p])
+            return
+
+        free = full & ~(cols | d1 | d2)
+        while free:
+            bit = free & -free
+            free ^= bit
+            p[c] = bit.bit_length() - 1
+            place(c + 1, cols | bit, ((d1 | bit) << 1) & full, (d2 | bit) >> 1)
+
+    place(len(prefix), cols, d1, d2)
+    return total, classes, boards
+
+
+def enumerate_solutions(n=8, workers=None, collect=True):
+    """
+    Deterministic, complete enumeration of the n-queens solutions.
+
+    Only boards whose first queen lies in the upper half are searched (the
+    canonical image of any solution is one of them), and every solution
+    found is kept only if it is canonical; its orbit size is added to the
+    total. The subtrees below the first two columns are spread over a
+    process pool (workers=1: serial, None: all cores).
+
+    Returns
+    -------
+    total : int
+        Number of solutions (92 for n = 8).
+    classes : int
+        Number of solutions up to symmetry (12 for n = 8).
+    boards : np.ndarray or None
+        (classes, n) canonical solutions, rows 1..n, sorted; None when
+        collect=False (counting only, which is what large n needs).
+    """
+    if n == 1:
+        return 1, 1, (np.ones((1, 1), dtype=int) if collect else None)
+
+    prefixes = [(r0, r1) for r0 in range((n + 1) // 2) for r1 in range(n)
+                if abs(r0 - r1) > 1]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        parts = [_subtree(n, pre, collect) for pre in prefixes]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_subtree, [n] * len(prefixes), prefixes,
+                                  [collect] * len(prefixes)))
+
+    total = sum(t for t, _, _ in parts)
+    classes = sum(k for _, k, _ in parts)
+    boards = None
+    if collect:
+        rows = [b for _, _, part in parts for b in part]
+        boards = np.array(sorted(rows), dtype=int).reshape(len(rows), n)
+    return total, classes, boards
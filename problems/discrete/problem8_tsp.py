@@ -1,33 +1,267 @@
+import hashlib
 import numpy as np
 import pandas as pd
 import os
 
-def load_points(csv_path="CaixeiroGrupos.csv", N=40):
+DEFAULT_CACHE_DIR = ".tsp_cache"
+MAX_MATRIX_BYTES = 256 * 2**20   # largest distance matrix built by default
+
+
+# --------------------------
+# Binary cache helpers
+# --------------------------
+
+def _file_hash(path):
+    """SHA-1 of a file's content, read in chunks."""
+    h = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def _array_hash(arr):
+    """SHA-1 of an array's shape and raw bytes (identifies a point set)."""
+    arr = np.ascontiguousarray(arr)
+    h = hashlib.sha1(str(arr.shape).encode())
+    h.update(arr.tobytes())
+    return h.hexdigest()[:16]
+
+
+def _cached_npy(path, build):
+    """
+    Memory-map `path` if it exists, otherwise build the array, save it
+    (atomically, so concurrent runs never read a half-written file) and map it.
+    """
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            np.save(fh, build())
+        os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
+
+
+# --------------------------
+# Loading
+# --------------------------
+
+def load_dataset(csv_path="CaixeiroGrupos.csv", cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Full CSV as a read-only (rows, 4) array: x, y, z, group.
+    The CSV is parsed once and stored as a memory-mapped .npy keyed by the
+    file's hash, so later calls (and edited CSVs) never re-parse stale data.
+    """
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    path = os.path.join(cache_dir, f"{stem}_{_file_hash(csv_path)}.npy")
+
+    def parse():
+        return pd.read_csv(csv_path, header=None).to_numpy(dtype=float)
+
+    return _cached_npy(path, parse)
+
+
+def load_points(csv_path="CaixeiroGrupos.csv", N=40, seed=None, cache_dir=DEFAULT_CACHE_DIR,
+                return_groups=False, rng=None):
     """
     Loads the CSV file and returns N random points in 3D.
     Professor says to choose 30 < N < 60.
+
+    N=None returns every row. The subset is drawn from rng when given,
+    else from default_rng(seed) when a seed is given (reproducible), else
+    from the global NumPy random state.
+    return_groups=True also returns the group label (4th column) of each point.
     """
-    df = pd.read_csv(csv_path, header=None)
-    df.columns = ["x", "y", "z", "group"]
-    df = df.sample(N)  # random subset
-    return df[['x','y','z']].to_numpy()
+    data = load_dataset(csv_path, cache_dir)
+
+    if N is None:
+        rows = slice(None)
+    else:
+        if rng is None:
+            rng = np.random.default_rng(seed) if seed is not None else np.random
+        rows = rng.choice(len(data), N, replace=False)
 
+    points = data[rows, :3] if N is None else np.array(data[rows, :3])
+    if return_groups:
+        return points, data[rows, 3].astype(int)
+    return points
 
-def route_length(route, points):
+
+def load_distances(points, k=8, max_matrix_bytes=MAX_MATRIX_BYTES, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Distance data for a point set, persisted next to the point cache.
+
+    Returns (D, neighbors): the full distance matrix (None when it would
+    exceed max_matrix_bytes) and the (N, k) nearest-neighbour table.
+    Both are memory-mapped and keyed by the hash of the points. Without a
+    matrix, GeneticTSP scores routes from the coordinates instead.
+    """
+    key = _array_hash(np.asarray(points, dtype=float))
+    N = len(points)
+
+    D = None
+    if N * N * 8 <= max_matrix_bytes:
+        D = _cached_npy(os.path.join(cache_dir, f"dist_{key}.npy"),
+                        lambda: distance_matrix(points))
+
+    neighbors = _cached_npy(os.path.join(cache_dir, f"knn{k}_{key}.npy"),
+                            lambda: nearest_neighbors(points, k))
+    return D, neighbors
+
+
+def city_dtype(N):
+    """
+    Smallest unsigned integer type able to hold city indices 0..N-1
+    (uint8 up to 256 cities, uint16 up to 65536, ...).
+    """
+    return np.min_scalar_type(max(N - 1, 0))
+
+
+def distance_matrix(points, chunk_bytes=32 * 2**20):
+    """
+    Pairwise Euclidean distances between all points (N x N).
+    Built once per instance so routes can be scored by table lookups.
+    Rows are computed in blocks so the coordinate differences never take
+    more than about chunk_bytes on top of the matrix itself.
+    """
+    pts = np.asarray(points, dtype=float)
+    N = len(pts)
+    rows = max(1, chunk_bytes // max(N * pts.shape[1] * 8, 1))
+
+    D = np.empty((N, N))
+    for start in range(0, N, rows):
+        diff = pts[start:start + rows, None, :] - pts[None, :, :]
+        D[start:start + rows] = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+    return D
+
+
+def edge_lengths(a, b, D=None, points=None):
+    """
+    Lengths of the edges a[i] -> b[i] (index arrays of any shape), looked
+    up in D when given, computed from the coordinates otherwise.
+    """
+    if D is not None:
+        return D[a, b]
+    pts = np.asarray(points, dtype=float)
+    return np.linalg.norm(pts[a] - pts[b], axis=-1)
+
+
+def route_length(route, points, D=None):
     """
     Compute total path length of a route (including returning to origin).
     Route is a permutation of indices.
+    If the distance matrix D is given, edges are looked up instead of recomputed.
+    """
+    route = np.asarray(route)
+    nxt = np.roll(route, -1)
+
+    if D is not None:
+        return float(D[route, nxt].sum())
+
+    pts = np.asarray(points)
+    return float(np.linalg.norm(pts[route] - pts[nxt], axis=1).sum())
+
+
+def route_lengths(pop, D, points=None):
     """
+    Total length of every route in a population at once.
+    pop is a (pop_size, N) array of permutations, D the distance matrix
+    (or None, to compute the edges from points). Returns a (pop_size,) array.
+    """
+    pop = np.asarray(pop)
+    return edge_lengths(pop, np.roll(pop, -1, axis=1), D, points).sum(axis=1)
+
+
+def swap_deltas(pop, i, j, D, points=None):
+    """
+    Change in route length caused by swapping the cities at positions i
+    and j, for many routes at once. Only the (at most four) edges touching
+    those positions are inspected, so the cost is O(1) per route.
+    pop is (m, N); i and j are (m,) positions to swap in each row.
+    D may be None to compute the edges from points.
+    Must be called BEFORE the swaps are applied.
+    """
+    pop = np.asarray(pop)
+    m, N = pop.shape
+    rows = np.arange(m)[:, None]
+
+    starts = np.sort(np.stack([(i - 1) % N, i, (j - 1) % N, j], axis=1), axis=1)
+    # adjacent swaps share an edge: count every starting position once
+    unique = np.ones(starts.shape, dtype=bool)
+    unique[:, 1:] = starts[:, 1:] != starts[:, :-1]
+    ends = (starts + 1) % N
+
+    swapped = pop.copy()
+    swapped[rows[:, 0], i] = pop[rows[:, 0], j]
+    swapped[rows[:, 0], j] = pop[rows[:, 0], i]
+
+    old = edge_lengths(pop[rows, starts], pop[rows, ends], D, points)
+    new = edge_lengths(swapped[rows, starts], swapped[rows, ends], D, points)
+    return ((new - old) * unique).sum(axis=1)
+
+
+def nearest_neighbors(points, k=8):
+    """
+    k nearest neighbours of every city, shape (N, k), closest first.
+
+    Points are bucketed into a uniform grid over the axes along which they
+    actually spread (flat axes, e.g. z = 0 for planar data, are ignored),
+    sized so that a cell holds about k points; each cell then only compares
+    its points against the cells in a growing cube around it, instead of
+    against all N cities. Once the cube holds more cells than are occupied,
+    or spans the whole extent, the cell's points are compared with all cities.
+    """
+    pts = np.asarray(points, dtype=float)
+    N = len(pts)
+    k = min(k, N - 1)
+    if k <= 0:
+        return np.empty((N, 0), dtype=int)
+
+    lo = pts.min(axis=0)
+    extent = pts.max(axis=0) - lo
+    spread = extent > 1e-12 * max(extent.max(), 1.0)
+    dims = int(spread.sum())
+    if dims == 0:   # all cities coincide
+        h = 1.0
+    else:
+        h = (np.prod(extent[spread]) * k / N) ** (1.0 / dims)
+        h = max(h, extent.max() / 1e6)
+    r_max = extent.max() / h
+
+    cells = np.floor((pts - lo) / h).astype(np.int64)
+    cells[:, ~spread] = 0
+    grid = {}
+    for idx, cell in enumerate(map(tuple, cells)):
+        grid.setdefault(cell, []).append(idx)
 
-    dist = 0.0
-    for i in range(len(route) - 1):
-        a = points[route[i]]
-        b = points[route[i+1]]
-        dist += np.linalg.norm(a - b)
+    everyone = np.arange(N)
+    result = np.empty((N, k), dtype=int)
 
-    # Return to the starting point
-    a = points[route[-1]]
-    b = points[route[0]]
-    dist += np.linalg.norm(a - b)
+    for cell, members in grid.items():
+        members = np.array(members)
+        r = 0
+        while True:
+            if (2 * r + 1) ** dims > len(grid) or r > r_max:
+                cand = everyone   # the cube covers every occupied cell anyway
+            else:
+                steps = [range(-r, r + 1) if s else (0,) for s in spread]
+                cand = [
+                    i
+                    for dx in steps[0]
+                    for dy in steps[1]
+                    for dz in steps[2]
+                    for i in grid.get((cell[0] + dx, cell[1] + dy, cell[2] + dz), ())
+                ]
+            if len(cand) > k:
+                cand = np.array(cand)
+                d = np.linalg.norm(pts[members, None, :] - pts[None, cand, :], axis=2)
+                d[members[:, None] == cand[None, :]] = np.inf  # a city is not its own neighbour
+                order = np.argsort(d, axis=1)[:, :k]
+                kth = np.take_along_axis(d, order[:, -1:], axis=1)
+                # anything outside the searched cube is at least r*h away
+                if len(cand) == N or np.all(kth <= r * h):
+                    result[members] = cand[order]
+                    break
+            r += 1
 
-    return dist
+    return result
@@ -0,0 +1,23 @@
+import numpy as np
+
+from algorithms.genetic_algorithm import GeneticTSP
+
+
+def _points(n, seed=0):
+    return np.random.default_rng(seed).uniform(0, 100, (n, 3))
+
+
+def test_tournament_contestants_distinct_when_k_equals_pop_size():
+    ga = GeneticTSP(_points(10), pop_size=30, tournament_k=30, rng=np.random.default_rng(0))
+    costs = np.random.default_rng(1).random(30)
+    winners = ga.tournament(costs, 500)
+    # every tournament holds the whole population, so the best always wins
+    assert np.all(winners == np.argmin(costs))
+
+
+def test_run_finishes_with_k_close_to_pop_size():
+    for k in (29, 30):
+        ga = GeneticTSP(_points(12), pop_size=30, max_gen=20, tournament_k=k,
+                        rng=np.random.default_rng(k))
+        ga.run()
+        assert sorted(ga.best_ind) == list(range(12))
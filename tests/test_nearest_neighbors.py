@@ -0,0 +1,42 @@
+import numpy as np
+
+from problems.discrete.problem8_tsp import nearest_neighbors
+
+
+def _brute_force(pts, k):
+    d = np.linalg.norm(pts[:, None, :] - pts[None, :, :], axis=2)
+    np.fill_diagonal(d, np.inf)
+    return np.sort(d, axis=1)[:, :k]
+
+
+def _check(pts, k=8):
+    nn = nearest_neighbors(pts, k)
+    d = np.linalg.norm(pts[:, None, :] - pts[nn], axis=2)
+    assert nn.shape == (len(pts), min(k, len(pts) - 1))
+    assert not np.any(nn == np.arange(len(pts))[:, None])
+    np.testing.assert_allclose(d, _brute_force(pts, k))
+
+
+def test_general_position():
+    _check(np.random.default_rng(0).uniform(0, 100, (300, 3)))
+
+
+def test_planar():
+    rng = np.random.default_rng(1)
+    for n in (20, 50, 500):
+        pts = np.column_stack([rng.uniform(0, 100, (n, 2)), np.zeros(n)])
+        _check(pts)
+
+
+def test_collinear():
+    rng = np.random.default_rng(2)
+    t = rng.uniform(0, 100, 200)
+    _check(np.column_stack([t, np.zeros_like(t), np.zeros_like(t)]))
+    _check(np.column_stack([t, 2 * t, np.full_like(t, 5.0)]))   # diagonal line
+
+
+def test_clustered_and_degenerate():
+    rng = np.random.default_rng(3)
+    far = np.array([[1e6, 1e6, 1e6]])
+    _check(np.vstack([rng.normal(0, 1e-3, (100, 3)), far]))
+    _check(np.zeros((10, 3)), k=4)
@@ -0,0 +1,131 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+
+# ============================================================
+# CONCURRENT EVALUATION OF BLACK-BOX OBJECTIVES
+# ============================================================
+
+class _LoopThread:
+    """Private asyncio event loop running in a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def _is_async(fn):
+    """True for `async def` functions and objects with an async __call__."""
+    return (inspect.iscoroutinefunction(fn)
+            or inspect.iscoroutinefunction(getattr(fn, "__call__", None)))
+
+
+class AsyncEvaluator:
+    """
+    Evaluate candidates of a slow black-box objective concurrently.
+
+    Parameters
+    ----------
+    fn : callable or coroutine function
+        Objective of ONE candidate, fn(x) -> float (e.g. a call into an
+        external solver). `async def` objectives run on a private event
+        loop; plain callables run on `executor`.
+    max_in_flight : int
+        Maximum number of evaluations submitted but not yet finished.
+    executor : concurrent.futures.Executor or None
+        Where plain callables run (default: a thread pool of max_in_flight
+        threads, owned and shut down by the evaluator). A caller-supplied
+        executor is left open.
+
+    Usage
+    -----
+    with AsyncEvaluator(simulate, max_in_flight=16) as ev:
+        grs = GlobalRandomSearch(None, domain, evaluator=ev)
+        best_x, best_f = grs.search()
+    """
+
+    def __init__(self, fn, max_in_flight=8, executor=None):
+        self.fn = fn
+        self.max_in_flight = max_in_flight
+        self.calls = 0  # objective calls submitted so far
+
+        self._loop = None
+        self._executor = executor
+        self._owns_executor = False
+
+        if _is_async(fn):
+            self._loop = _LoopThread()
+        elif executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+            self._owns_executor = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Stop the private event loop / thread pool, if any."""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        if self._owns_executor:
+            self._executor.shutdown()
+            self._owns_executor = False
+
+    def submit(self, x):
+        """Start one evaluation; returns a concurrent.futures.Future."""
+        self.calls += 1
+        if self._loop is not None:
+            return self._loop.submit(self.fn(x))
+        return self._executor.submit(self.fn, x)
+
+    def as_completed(self, candidates):
+        """
+        Yield (index, value) for every candidate as results arrive.
+
+        `candidates` may be a lazy iterable: it is only advanced while fewer
+        than max_in_flight evaluations are pending, so an unbounded stream
+        of samples never piles up in memory.
+        """
+        it = iter(enumerate(candidates))
+        pending = {}
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < self.max_in_flight:
+                try:
+                    i, x = next(it)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[self.submit(x)] = i
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield pending.pop(fut), fut.result()
+
+    def evaluate(self, candidates):
+        """Objective values of all candidates, in input order."""
+        candidates = list(candidates)
+        values = np.empty(len(candidates), dtype=float)
+        for i, value in self.as_completed(candidates):
+            values[i] = value
+        return values
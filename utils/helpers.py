@@ -1,4 +1,5 @@
 import csv
+import itertools
 import os
 import numpy as np
 
@@ -24,6 +25,111 @@ def save_table(name, results):
 # MODE COMPUTATION FOR CONTINUOUS SOLUTIONS
 # ============================================================
 
+def _tol_clusters(points, tol):
+    """
+    Greedy clustering of an (n, d) array: in index order, every point not
+    yet clustered starts a cluster holding every LATER point closer than
+    tol to it, clustered or not (so clusters may overlap, as they always
+    have here). Returns the clusters (index arrays, ascending) in order of
+    creation.
+
+    Points are hashed into a grid of cells of side tol, so a leader is only
+    compared with the points of the 3^d cells around its own (O(n) instead
+    of the O(n^2) pairwise loop). Only when 3^d exceeds the number of
+    occupied cells (high d) are the occupied cells next to the leader's
+    found with a vectorized scan instead.
+    """
+    n, d = points.shape
+    if tol <= 0:
+        return [np.array([i]) for i in range(n)]
+
+    # integer cell of every point and a linear 64-bit hash of it:
+    # code(key + offset) = code(key) + code(offset) (mod 2^64), so the
+    # codes of neighbouring cells follow from the cell's own code
+    keys = np.floor(points / tol).astype(np.int64)
+    weights = np.random.default_rng(0).integers(1, 2**63, d, dtype=np.uint64) | np.uint64(1)
+    codes = (keys.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+    # cells numbered 0..C-1; the points of cell c are order[starts[c]:starts[c + 1]]
+    cell_codes, first, cell_of = np.unique(codes, return_index=True, return_inverse=True)
+    cell_of = cell_of.ravel()
+    hashed = np.array_equal(keys, keys[first][cell_of])   # False on a hash collision
+    if not hashed:
+        _, first, cell_of = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        cell_of = cell_of.ravel()
+    cell_keys = keys[first]
+    n_cells = len(first)
+
+    sizes = np.bincount(cell_of, minlength=n_cells)
+    order = np.argsort(cell_of, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(sizes)])
+
+    # neighbour table: the occupied cells among the 3^d around each cell
+    # (an unoccupied key whose code collides only adds candidates, which
+    # the distance test then rejects)
+    neighbours = None
+    if hashed and d * np.log(3) <= np.log(n_cells):
+        offsets = np.array(list(itertools.product((-1, 0, 1), repeat=d)), dtype=np.int64)
+        offset_codes = (offsets.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+        wanted = cell_codes[:, None] + offset_codes
+        pos = np.searchsorted(cell_codes, wanted).clip(max=n_cells - 1)
+        neighbours = np.where(cell_codes[pos] == wanted, pos, -1)
+
+    # points alone in their neighbourhood are clusters of their own
+    alone = np.zeros(n, dtype=bool)
+    if neighbours is not None:
+        crowd = np.where(neighbours >= 0, sizes[neighbours], 0).sum(axis=1)
+        alone = crowd[cell_of] == 1
+
+    used = np.zeros(n, dtype=bool)
+    clusters = []
+
+    for i in range(n):
+        if used[i]:
+            continue
+        used[i] = True
+        if alone[i]:
+            clusters.append(np.array([i]))
+            continue
+
+        c = cell_of[i]
+        if neighbours is not None:
+            near = neighbours[c][neighbours[c] >= 0]
+        else:
+            near = np.flatnonzero(np.max(np.abs(cell_keys - cell_keys[c]), axis=1) <= 1)
+
+        cand = np.concatenate([order[starts[k]:starts[k + 1]] for k in near])
+        cand = cand[cand > i]
+
+        close = cand[np.linalg.norm(points[cand] - points[i], axis=1) < tol]
+        used[close] = True
+        clusters.append(np.concatenate([[i], np.sort(close)]))
+
+    return clusters
+
+
+def compute_modes(results, tol=1e-3):
+    """
+    Every cluster of solutions (see compute_mode), largest first.
+
+    Returns:
+    --------
+    list of (mode_x, mode_f, count)
+        Mean coordinates, mean function value and size of each cluster.
+        Clusters of equal size keep the order in which they were found.
+    """
+    if len(results) == 0:
+        return []
+
+    points = np.array([x for x, _ in results], dtype=float).reshape(len(results), -1)
+    values = np.array([f for _, f in results], dtype=float)
+
+    clusters = _tol_clusters(points, tol)
+    clusters.sort(key=len, reverse=True)   # stable: ties keep their order
+
+    return [(np.mean(points[c], axis=0), np.mean(values[c]), len(c)) for c in clusters]
+
+
 def compute_mode(results, tol=1e-3):
     """
     Compute mode (most frequent solution) among continuous solutions.
@@ -31,7 +137,7 @@ def compute_mode(results, tol=1e-3):
     Parameters:
     -----------
     results : list of (x_best, f_best)
-        Each x_best is a numpy array: [x1, x2]
+        Each x_best is a numpy array: [x1, x2] (any dimension)
 
     tol : float
         Tolerance for clustering continuous values.
@@ -47,33 +153,18 @@ def compute_mode(results, tol=1e-3):
 
     count : int
         Number of appearances of the mode
+
+    The clustering is grid-hashed (see _tol_clusters), so 10^5-10^6 runs
+    are fine; compute_modes returns every cluster, not just the largest.
     """
 
     if len(results) == 0:
         return None, None, 0
 
-    # Extract only coordinates
-    points = np.array([x for x, _ in results])
-
-    # We cluster points using tolerance
-    used = np.zeros(len(points), dtype=bool)
-    clusters = []
-
-    for i in range(len(points)):
-        if used[i]:
-            continue
-
-        cluster = [i]
-        used[i] = True
+    points = np.array([x for x, _ in results], dtype=float).reshape(len(results), -1)
 
-        for j in range(i + 1, len(points)):
-            if np.linalg.norm(points[i] - points[j]) < tol:
-                cluster.append(j)
-                used[j] = True
-
-        clusters.append(cluster)
-
-    # Find largest cluster
+    # Find largest cluster (the first one found on ties)
+    clusters = _tol_clusters(points, tol)
     largest = max(clusters, key=len)
     count = len(largest)
 
@@ -86,6 +177,29 @@ def compute_mode(results, tol=1e-3):
     return mode_x, mode_f, count
 
 
+def integer_mode(values):
+    """
+    Mode of integer data (e.g. generation counts) from a histogram.
+
+    Returns:
+    --------
+    mode : int
+        Most frequent value (the one seen first on ties, like compute_mode).
+    count : int
+        Its number of occurrences.
+    histogram : (np.ndarray, np.ndarray)
+        Every distinct value and its count, sorted by value.
+    """
+    values = np.asarray(values, dtype=np.int64).ravel()
+    if len(values) == 0:
+        return None, 0, (values, values)
+
+    uniq, first, counts = np.unique(values, return_index=True, return_counts=True)
+    top = np.flatnonzero(counts == counts.max())
+    best = top[np.argmin(first[top])]
+    return int(uniq[best]), int(counts[best]), (uniq, counts)
+
+
 def save_mode(name, mode_x, mode_f, count):
     """
     Save mode information into CSV.
@@ -0,0 +1,179 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+# ============================================================
+# MEMOIZATION FOR DISCRETE OBJECTIVES
+# ============================================================
+
+class MemoCache:
+    """
+    Bounded LRU cache of objective values, keyed on the packed bytes of a
+    solution (so boards / routes must keep one dtype for their lifetime).
+
+    Parameters
+    ----------
+    f : callable or None
+        Objective of one solution, used by __call__.
+    f_batch : callable or None
+        Objective of an (m, n) array of solutions, used by batch().
+    maxsize : int
+        Entries kept; the least recently used one is evicted first.
+
+    Usage
+    -----
+    cached_f = MemoCache(f, maxsize=10_000)
+    sa = SimulatedAnnealingDiscrete(f=cached_f, ...)
+    print(cached_f.stats())
+    """
+
+    def __init__(self, f=None, f_batch=None, maxsize=100_000):
+        self.f = f
+        self.f_batch = f_batch
+        self.maxsize = maxsize
+        self._values = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(x):
+        return np.ascontiguousarray(x).tobytes()
+
+    def _get(self, key):
+        value = self._values.get(key)
+        if value is not None:
+            self._values.move_to_end(key)
+        return value
+
+    def _put(self, key, value):
+        self._values[key] = value
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+    def __call__(self, x):
+        """f(x), computed at most once while x stays cached."""
+        key = self.key(x)
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+            value = self.f(x)
+            self._put(key, value)
+        else:
+            self.hits += 1
+        return value
+
+    def batch(self, X, f_batch=None):
+        """
+        Values of every row of X. Cached rows are looked up; the distinct
+        uncached rows are evaluated with ONE f_batch call (duplicates inside
+        X are scored once as well).
+        """
+        f_batch = f_batch if f_batch is not None else self.f_batch
+        X = np.asarray(X)
+        values = np.empty(len(X), dtype=float)
+
+        todo = {}  # key -> rows of X waiting for that value
+        for i, x in enumerate(X):
+            key = self.key(x)
+            value = self._get(key)
+            if value is None:
+                todo.setdefault(key, []).append(i)
+            else:
+                values[i] = value
+
+        self.misses += len(todo)
+        self.hits += len(X) - len(todo)
+
+        if todo:
+            first = [rows[0] for rows in todo.values()]
+            new = np.asarray(f_batch(X[first]), dtype=float)
+            for (key, rows), value in zip(todo.items(), new):
+                values[rows] = value
+                self._put(key, value)
+
+        return values
+
+    @property
+    def hit_rate(self):
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def stats(self):
+        """Hit / miss counters and current size, for reporting."""
+        return dict(hits=self.hits, misses=self.misses, hit_rate=self.hit_rate,
+                    size=len(self._values))
+
+
+class LookupTable:
+    """
+    Dense table of an objective over a fully enumerable space: every
+    solution in {low, ..., high}^n, addressed in mixed radix. The table is
+    built once with a batched objective, saved as .npy and memory-mapped,
+    so later runs (and other processes) only read it.
+
+    Parameters
+    ----------
+    f_batch : callable
+        Objective of an (m, n) array of solutions (used only to build).
+    n : int
+        Solution length.
+    low, high : int
+        Value range of every position.
+    path : str
+        .npy file holding the table.
+    dtype : np.dtype
+        Storage type of the values (uint8 fits the 8-queens objective).
+    chunk : int
+        Solutions scored per f_batch call while building.
+    """
+
+    def __init__(self, f_batch, n, low, high, path, dtype=np.uint8, chunk=1 << 20):
+        self.n = n
+        self.low = low
+        self.base = high - low + 1
+        self.weights = self.base ** np.arange(n - 1, -1, -1, dtype=np.int64)
+
+        self.hits = 0
+
+        size = self.base ** n
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            table = np.empty(size, dtype=dtype)
+            for start in range(0, size, chunk):
+                idx = np.arange(start, min(start + chunk, size), dtype=np.int64)
+                table[idx] = f_batch(self.solutions(idx))
+
+            tmp = f"{path}.{os.getpid()}.tmp"   # atomic: never read half-written
+            with open(tmp, "wb") as fh:
+                np.save(fh, table)
+            os.replace(tmp, path)
+
+        self.table = np.load(path, mmap_mode="r")
+
+    def index(self, X):
+        """Table positions of a solution or of the rows of an (m, n) array."""
+        return (np.asarray(X, dtype=np.int64) - self.low) @ self.weights
+
+    def solutions(self, idx):
+        """Inverse of index: the (m, n) solutions at table positions idx."""
+        digits = (np.asarray(idx)[:, None] // self.weights) % self.base
+        return digits + self.low
+
+    def __call__(self, x):
+        self.hits += 1
+        return int(self.table[self.index(x)])
+
+    def batch(self, X):
+        X = np.asarray(X)
+        self.hits += len(X)
+        return self.table[self.index(X)].astype(np.int64)
+
+    @property
+    def hit_rate(self):
+        return 1.0   # every query is a lookup
+
+    def stats(self):
+        return dict(hits=self.hits, misses=0, hit_rate=1.0, size=len(self.table))
@@ -0,0 +1,88 @@
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# ============================================================
+# ZERO-COPY SHARED ARRAYS FOR WORKER PROCESSES
+# ============================================================
+
+# SharedMemory blocks attached by this process, keyed by block name.
+# They must stay referenced for as long as the NumPy views are used.
+_attached = {}
+_views = {}
+
+
+class SharedArrays:
+    """
+    Publish NumPy arrays once into shared memory for worker processes.
+
+    Usage
+    -----
+    with SharedArrays(points=points, D=D) as shared:
+        run_parallel(task, ..., initializer=attach_shared,
+                     initargs=(shared.handles,))
+
+    Workers then read the arrays with shared_array("points") etc. without
+    receiving a pickled copy per task. Leaving the block unlinks the memory.
+    """
+
+    def __init__(self, **arrays):
+        self._blocks = []
+        self.handles = {}
+
+        try:
+            for key, arr in arrays.items():
+                arr = np.ascontiguousarray(arr)
+                shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+                self._blocks.append(shm)
+                np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+                self.handles[key] = (shm.name, arr.shape, arr.dtype.str)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Drop local attachments and free the shared blocks."""
+        for key, (name, _, _) in self.handles.items():
+            _views.pop(key, None)
+            shm = _attached.pop(name, None)
+            if shm is not None:
+                shm.close()
+
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+
+def attach_shared(handles):
+    """
+    Attach published arrays as read-only views (pool initializer).
+    Attaching the same block twice reuses the existing mapping.
+    """
+    for key, (name, shape, dtype) in handles.items():
+        shm = _attached.get(name)
+        if shm is None:
+            if sys.version_info >= (3, 13):
+                # only the creator should unlink the block
+                shm = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                shm = shared_memory.SharedMemory(name=name)
+            _attached[name] = shm
+
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        view.flags.writeable = False
+        _views[key] = view
+
+
+def shared_array(key):
+    """Read-only view of an array attached with attach_shared."""
+    return _views[key]